@@ -0,0 +1,260 @@
+"""
+File copy strategy selection.
+
+Copy handlers move whole files from the source tree into the sandbox.
+The fastest correct way to do that depends on the filesystem that hosts
+the sandbox and on the running kernel:
+
+- reflink (``FICLONE``) on copy-on-write filesystems (btrfs, xfs, bcachefs)
+- ``copy_file_range`` on Linux >= 5.3
+- ``shutil.copy2`` everywhere else (which itself uses ``sendfile`` on
+  Linux and ``fcopyfile`` on macOS)
+
+Selection happens once per sandbox root, not once per file, so the copy
+hot path never re-probes or retries syscalls the host cannot serve.
+
+Every strategy preserves ``shutil.copy2`` semantics: file content plus
+permission bits and timestamps, and ``shutil.SameFileError`` when source
+and target are the same file (checked before the target is opened, so it
+is never truncated). Fast strategies fall back to ``shutil.copy2`` if the
+kernel refuses the operation or stops before the whole file is copied.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "CopyImpl",
+    "select_copy_impl",
+]
+
+CopyImpl = Callable[[Path, Path], None]
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+_REFLINK_FILESYSTEMS = frozenset({"btrfs", "xfs", "bcachefs"})
+
+# Errors meaning "this host cannot do that", as opposed to real I/O failures.
+_UNSUPPORTED_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.ENOTTY,
+        errno.EOPNOTSUPP,
+        errno.EBADF,
+    }
+)
+
+
+# =============================================================================
+# Strategies
+# =============================================================================
+
+
+def _copy_portable(source: Path, target: Path) -> None:
+    """Copy via ``shutil.copy2``."""
+    shutil.copy2(source, target)
+
+
+def _ensure_distinct(source: Path, target: Path) -> None:
+    """
+    Raise ``shutil.SameFileError`` if ``target`` is ``source``.
+
+    Mirrors the check ``shutil.copy2`` makes; the fast strategies open the
+    target for writing, which would truncate a shared file to empty.
+    """
+    try:
+        same = os.path.samefile(source, target)
+    except OSError:
+        # Target does not exist yet (or cannot be stat'ed): not the same.
+        return
+
+    if same:
+        raise shutil.SameFileError(
+            f"{str(source)!r} and {str(target)!r} are the same file"
+        )
+
+
+def _copy_reflink(source: Path, target: Path) -> None:
+    """Clone file extents with ``FICLONE``; fall back on refusal."""
+    import fcntl
+
+    _ensure_distinct(source, target)
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            cloned = False
+        else:
+            cloned = True
+
+    if not cloned:
+        _copy_file_range_or_portable(source, target)
+        return
+
+    shutil.copystat(source, target)
+
+
+def _copy_file_range(source: Path, target: Path) -> None:
+    """
+    Copy in-kernel with ``os.copy_file_range``.
+
+    Falls back to ``shutil.copy2`` (which rewrites the whole target) if the
+    kernel refuses the first call or stops short of the full size.
+    """
+    _ensure_distinct(source, target)
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        copied = 0
+
+        while remaining > 0:
+            try:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            except OSError as exc:
+                if copied == 0 and exc.errno in _UNSUPPORTED_ERRNOS:
+                    break
+                raise
+
+            if n == 0:
+                break
+
+            copied += n
+            remaining -= n
+
+    if remaining > 0:
+        if copied:
+            LOGGER.debug(
+                "copy_file_range stopped after %d bytes; "
+                "recopying %s portably",
+                copied,
+                source,
+            )
+        _copy_portable(source, target)
+        return
+
+    shutil.copystat(source, target)
+
+
+def _copy_file_range_or_portable(source: Path, target: Path) -> None:
+    """Use ``copy_file_range`` when the kernel supports it."""
+    if _SUPPORTS_COPY_FILE_RANGE:
+        _copy_file_range(source, target)
+    else:
+        _copy_portable(source, target)
+
+
+# =============================================================================
+# Probing
+# =============================================================================
+
+
+def _kernel_version() -> Tuple[int, int]:
+    """Return ``(major, minor)`` of the running kernel, or ``(0, 0)``."""
+    release = os.uname().release if hasattr(os, "uname") else ""
+    parts = release.split(".", 2)
+
+    try:
+        return int(parts[0]), int("".join(ch for ch in parts[1] if ch.isdigit()))
+    except (IndexError, ValueError):
+        return 0, 0
+
+
+_SUPPORTS_COPY_FILE_RANGE = (
+    sys.platform.startswith("linux")
+    and hasattr(os, "copy_file_range")
+    and _kernel_version() >= (5, 3)
+)
+
+
+@lru_cache(maxsize=1)
+def _mount_table() -> Tuple[Tuple[str, str], ...]:
+    """
+    Return ``(mount_point, fstype)`` pairs, longest mount point first.
+
+    Read once per process from ``/proc/mounts``.
+    """
+    mounts: Dict[str, str] = {}
+
+    try:
+        with open("/proc/mounts", encoding="utf-8") as fh:
+            for line in fh:
+                fields = line.split()
+                if len(fields) >= 3:
+                    mount_point = fields[1].replace("\\040", " ")
+                    mounts[mount_point] = fields[2]
+    except OSError:
+        return ()
+
+    return tuple(
+        sorted(mounts.items(), key=lambda item: len(item[0]), reverse=True)
+    )
+
+
+def _filesystem_type(path: Path) -> Optional[str]:
+    """Return the fstype of the mount containing ``path``, if known."""
+    path_str = str(path)
+
+    for mount_point, fstype in _mount_table():
+        prefix = mount_point.rstrip("/") + "/"
+        if path_str == mount_point or path_str.startswith(prefix):
+            return fstype
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _select_for(fstype: Optional[str], kernel: Tuple[int, int]) -> CopyImpl:
+    """Pick a strategy for a ``(fstype, kernel)`` deployment shape."""
+    if not sys.platform.startswith("linux"):
+        return _copy_portable
+
+    if fstype in _REFLINK_FILESYSTEMS:
+        return _copy_reflink
+
+    if _SUPPORTS_COPY_FILE_RANGE:
+        return _copy_file_range
+
+    return _copy_portable
+
+
+def select_copy_impl(root: Path) -> CopyImpl:
+    """
+    Select the copy strategy for files written under ``root``.
+
+    Parameters
+    ----------
+    root:
+        Resolved directory that receives copied files.
+
+    Returns
+    -------
+    CopyImpl
+        Callable ``(source, target) -> None`` with ``shutil.copy2``
+        semantics.
+    """
+    fstype = _filesystem_type(root) if sys.platform.startswith("linux") else None
+    impl = _select_for(fstype, _kernel_version())
+
+    LOGGER.debug(
+        "Selected copy strategy root=%s fstype=%s impl=%s",
+        root,
+        fstype,
+        impl.__name__,
+    )
+    return impl
@@ -124,6 +124,12 @@ class ExecutionDispatcher:
         results: List[ExecutionActionResult] = []
         started_at = datetime.now(UTC)
 
+        # Loop invariants are bound once: the executor entry point, the
+        # result sink and the DEBUG level check do not change per action.
+        execute = self._executor.execute
+        append_result = results.append
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+
         for index, action in enumerate(actions):
             if not isinstance(action, dict):
                 LOGGER.error("Action[%d] is not a dictionary", index)
@@ -133,14 +139,15 @@ class ExecutionDispatcher:
 
             action_id = str(action.get("id", "<unknown>"))
 
-            LOGGER.debug(
-                "Dispatching action index=%d id=%s",
-                index,
-                action_id,
-            )
+            if debug:
+                LOGGER.debug(
+                    "Dispatching action index=%d id=%s",
+                    index,
+                    action_id,
+                )
 
             try:
-                result = self._executor.execute(action)
+                result = execute(action)
 
                 if not isinstance(result, ExecutionActionResult):
                     raise ExecutionDispatchError(
@@ -164,10 +171,10 @@ class ExecutionDispatcher:
                     error_type="executor_error",
                 )
 
-                results.append(result)
+                append_result(result)
                 break
 
-            results.append(result)
+            append_result(result)
 
         finished_at = datetime.now(UTC)
 
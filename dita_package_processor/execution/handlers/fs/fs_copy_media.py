@@ -24,7 +24,6 @@ Design principles
 from __future__ import annotations
 
 import logging
-import shutil
 from pathlib import Path
 from typing import Any, Dict
 
@@ -209,8 +208,8 @@ class CopyMediaHandler(ExecutionHandler):
         # -------------------------------------------------
 
         try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, target_path)
+            sandbox.ensure_parent(target_path)
+            sandbox.copy_file(source_path, target_path)
 
             LOGGER.info(
                 "copy_media succeeded id=%s %s → %s",
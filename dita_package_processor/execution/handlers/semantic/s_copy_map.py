@@ -23,7 +23,6 @@ Design principles
 from __future__ import annotations
 
 import logging
-import shutil
 from pathlib import Path
 from typing import Any, Dict
 
@@ -188,8 +187,8 @@ class CopyMapHandler(ExecutionHandler):
         # -------------------------------------------------
 
         try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, target_path)
+            sandbox.ensure_parent(target_path)
+            sandbox.copy_file(source_path, target_path)
 
             LOGGER.info(
                 "copy_map succeeded id=%s %s → %s",
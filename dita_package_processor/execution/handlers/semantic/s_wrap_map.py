@@ -179,7 +179,7 @@ class WrapMapHandler(ExecutionHandler):
             ET.SubElement(concept, "title").text = title
             ET.SubElement(concept, "conbody")
 
-            wrapper_topic.parent.mkdir(parents=True, exist_ok=True)
+            sandbox.ensure_parent(wrapper_topic)
 
             ET.ElementTree(concept).write(
                 wrapper_topic,
@@ -16,6 +16,11 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from dita_package_processor.execution.copy_strategy import (
+    CopyImpl,
+    select_copy_impl,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -46,6 +51,11 @@ class Sandbox:
         """
         self.root = root.resolve()
 
+        # Parent directories already ensured by this sandbox. Handlers write
+        # many files into few directories, so each directory is created (and
+        # its ancestors stat-ed) once per sandbox rather than once per file.
+        self._ensured_dirs: set[Path] = set()
+
         LOGGER.debug("Initializing sandbox with root: %s", self.root)
 
         if not self.root.exists():
@@ -58,6 +68,10 @@ class Sandbox:
                 f"Sandbox root is not a directory: {self.root}"
             )
 
+        # The copy strategy depends only on the filesystem hosting the root,
+        # so it is chosen once here and reused for every copy.
+        self._copy_impl: CopyImpl = select_copy_impl(self.root)
+
     def resolve(self, path: Path) -> Path:
         """
         Resolve a path inside the sandbox.
@@ -103,6 +117,50 @@ class Sandbox:
 
         return resolved
 
+    def ensure_parent(self, path: Path) -> Path:
+        """
+        Ensure the parent directory of a sandbox path exists.
+
+        Directories are created at most once per sandbox; repeat calls for
+        files in the same directory are a set lookup. This assumes nothing
+        removes a directory inside the sandbox once it has been ensured:
+        if one is deleted, later calls will not recreate it.
+
+        Parameters
+        ----------
+        path:
+            Path previously returned by :meth:`resolve`.
+
+        Returns
+        -------
+        Path
+            The parent directory.
+        """
+        parent = path.parent
+
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+            LOGGER.debug("Ensured sandbox directory: %s", parent)
+
+        return parent
+
+    def copy_file(self, source: Path, target: Path) -> None:
+        """
+        Copy a file into the sandbox with ``shutil.copy2`` semantics.
+
+        Uses the strategy selected for this sandbox's filesystem
+        (reflink, ``copy_file_range`` or portable copy).
+
+        Parameters
+        ----------
+        source:
+            Resolved source file.
+        target:
+            Path previously returned by :meth:`resolve`.
+        """
+        self._copy_impl(source, target)
+
     def _is_inside_root(self, path: Path) -> bool:
         """
         Check whether a path is inside the sandbox root.
@@ -27,12 +27,19 @@ Default policy:
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 LOGGER = logging.getLogger(__name__)
 
+# Backslash separators and drive letters only exist on Windows; on POSIX
+# both '\\' and ':' are ordinary filename characters.
+_WINDOWS = os.name == "nt"
+_ROOT_PREFIXES = ("/", "\\") if _WINDOWS else ("/",)
+
 
 # ---------------------------------------------------------------------------
 # Errors
@@ -67,25 +74,35 @@ class LayoutPolicy(Protocol):
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _validate_relative_path(rel_path: Path) -> None:
+def _validate_relative_path(rel_path: Path | str) -> None:
     """
     Validate that a path is a safe relative path.
 
     Rules:
-    - must not be absolute
+    - must not be absolute (a leading '/'; on Windows also a leading
+      '\\' or a drive letter)
     - must not contain '..' components
     - must not be empty
 
+    Validation is performed on the string form so callers holding plain
+    strings never pay for ``Path`` construction. Backslashes count as
+    separators on Windows only, matching the platform's ``Path`` rules.
+
     :param rel_path: Path to validate.
     :raises LayoutError: If invalid.
     """
-    if not rel_path or str(rel_path).strip() == "":
+    rel_str = rel_path if isinstance(rel_path, str) else str(rel_path)
+
+    if rel_str.strip() == "":
         raise LayoutError("Empty path cannot be mapped")
 
-    if rel_path.is_absolute():
+    if rel_str.startswith(_ROOT_PREFIXES) or (
+        _WINDOWS and rel_str[1:2] == ":"
+    ):
         raise LayoutError(f"Absolute paths are not allowed: {rel_path}")
 
-    if ".." in rel_path.parts:
+    segments = rel_str.replace("\\", "/") if _WINDOWS else rel_str
+    if ".." in segments.split("/"):
         raise LayoutError(f"Path traversal is not allowed: {rel_path}")
 
 
@@ -152,6 +169,48 @@ class DefaultDitaLayoutPolicy:
         return mapped
 
 
+@lru_cache(maxsize=4096)
+def _map_relative_path_cached(policy: LayoutPolicy, rel_path_str: str) -> Path:
+    """
+    Map and validate a relative path through a policy, memoized.
+
+    Only called for frozen dataclass policies (see
+    :func:`_is_value_hashed_policy`): they are hashed and compared by
+    value and cannot change after construction, so a cached mapping can
+    never go stale and equal policies share entries.
+
+    :param policy: Frozen dataclass layout policy.
+    :param rel_path_str: Relative artifact path as a string.
+    :return: Validated relative target path.
+    :raises LayoutError: If the mapped path is unsafe.
+    """
+    mapped = policy.map_relative_path(Path(rel_path_str))
+    _validate_relative_path(mapped)
+    return mapped
+
+
+def _is_value_hashed_policy(policy: Any) -> bool:
+    """
+    Return True if ``policy`` is a hashable frozen dataclass with value
+    equality.
+
+    Ordinary objects are hashable by identity, which would let a policy
+    with internal state serve stale mappings and keep it alive in the
+    module-level cache; such policies are mapped on every call instead.
+    A frozen dataclass with an unhashable field (a dict or list) raises
+    ``TypeError`` when hashed and takes the uncached path as well.
+    """
+    params = getattr(type(policy), "__dataclass_params__", None)
+    if params is None or not (params.frozen and params.eq):
+        return False
+
+    try:
+        hash(policy)
+    except TypeError:
+        return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Resolver
 # ---------------------------------------------------------------------------
@@ -170,18 +229,26 @@ class TargetLayout:
     target_root: Path
     policy: LayoutPolicy = DefaultDitaLayoutPolicy()
 
-    def resolve(self, *, rel_path: Path) -> Path:
+    def resolve(self, *, rel_path: Path | str) -> Path:
         """
         Resolve a relative artifact path to a concrete path under target_root.
 
+        Plain strings are accepted as a fast path: they are validated and
+        used as cache keys directly, and a ``Path`` is only built when the
+        policy mapping is not already cached.
+
         :param rel_path: Relative artifact path (must be safe).
         :return: Concrete target path.
         :raises LayoutError: If rel_path is invalid or unsafe.
         """
-        _validate_relative_path(rel_path)
+        rel_str = rel_path if isinstance(rel_path, str) else str(rel_path)
+        _validate_relative_path(rel_str)
 
-        mapped_rel = self.policy.map_relative_path(rel_path)
-        _validate_relative_path(mapped_rel)
+        if _is_value_hashed_policy(self.policy):
+            mapped_rel = _map_relative_path_cached(self.policy, rel_str)
+        else:
+            mapped_rel = self.policy.map_relative_path(Path(rel_str))
+            _validate_relative_path(mapped_rel)
 
         resolved = self.target_root / mapped_rel
         LOGGER.debug("Resolved target path: %s -> %s", rel_path, resolved)
@@ -223,7 +290,7 @@ class MaterializationLayoutEngine:
 
         LOGGER.info("MaterializationLayoutEngine initialized for %s", target_root)
 
-    def resolve_path(self, *, rel_path: Path) -> Path:
+    def resolve_path(self, *, rel_path: Path | str) -> Path:
         """
         Resolve an artifact-relative path into its target location.
 
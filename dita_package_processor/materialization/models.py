@@ -19,19 +19,24 @@ They DO:
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+# Shared read-only metadata for files without layout annotations.
+_EMPTY_METADATA: Mapping[str, str] = MappingProxyType({})
+
 
 # ----------------------------------------------------------------------
 # Core materialization semantics
 # ----------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterializedFile:
     """
     Declarative record of a single materialized file.
@@ -49,12 +54,31 @@ class MaterializedFile:
     layout_metadata:
         Deterministic layout annotations explaining how this file
         was placed (policy name, original relative path, etc.).
+        Stored as a read-only mapping; an existing ``MappingProxyType``
+        is shared as-is, any other mapping is copied once.
+    path_str:
+        Cached ``str(path)``, computed once at construction and reused by
+        serialization and manifest validation.
     """
 
     path: Path
     source_action_id: Optional[str] = None
     role: Optional[str] = None
-    layout_metadata: Dict[str, str] = field(default_factory=dict)
+    layout_metadata: Mapping[str, str] = field(default_factory=dict)
+    path_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Cache the string form of ``path`` and freeze ``layout_metadata``.
+        """
+        object.__setattr__(self, "path_str", str(self.path))
+
+        metadata = self.layout_metadata
+        if not metadata:
+            metadata = _EMPTY_METADATA
+        elif not isinstance(metadata, MappingProxyType):
+            metadata = MappingProxyType(dict(metadata))
+        object.__setattr__(self, "layout_metadata", metadata)
 
     def to_dict(self) -> Dict[str, object]:
         """
@@ -64,7 +88,7 @@ class MaterializedFile:
         """
         LOGGER.debug("Serializing MaterializedFile path=%s", self.path)
         return {
-            "path": str(self.path),
+            "path": self.path_str,
             "source_action_id": self.source_action_id,
             "role": self.role,
             "layout_metadata": dict(self.layout_metadata),
@@ -76,7 +100,7 @@ class MaterializedFile:
 # ----------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterializationManifest:
     """
     Declarative manifest describing a fully materialized target package.
@@ -91,20 +115,31 @@ class MaterializationManifest:
     """
 
     target_root: Path
-    files: List[MaterializedFile]
+    files: Tuple[MaterializedFile, ...]
     metadata: Dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """
         Enforce collision-free and structurally valid manifests.
+
+        ``files`` is frozen into a tuple so the manifest cannot be mutated
+        through the caller's original list.
         """
+        object.__setattr__(self, "files", tuple(self.files))
+
         LOGGER.debug(
             "Validating MaterializationManifest target_root=%s files=%d",
             self.target_root,
             len(self.files),
         )
 
-        seen: Set[Path] = set()
+        # Containment and collision checks are lexical and single-pass:
+        # paths are normalized once as strings, so neither check walks
+        # ``Path.parents`` or issues a ``resolve()`` syscall per file.
+        root_str = os.path.normpath(str(self.target_root))
+        root_prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+        seen: Set[str] = set()
 
         for file in self.files:
             if not file.path.is_absolute():
@@ -112,18 +147,19 @@ class MaterializationManifest:
                     f"MaterializedFile path must be absolute: {file.path}"
                 )
 
-            if self.target_root not in file.path.parents:
+            normalized = os.path.normpath(file.path_str)
+
+            if not normalized.startswith(root_prefix):
                 raise ValueError(
                     f"File path {file.path} is not under target_root {self.target_root}"
                 )
 
-            resolved = file.path.resolve()
-            if resolved in seen:
+            if normalized in seen:
                 raise ValueError(
-                    f"Duplicate materialized target path detected: {resolved}"
+                    f"Duplicate materialized target path detected: {normalized}"
                 )
 
-            seen.add(resolved)
+            seen.add(normalized)
 
         LOGGER.info(
             "MaterializationManifest validated: %d files, collision-free",
@@ -149,9 +185,21 @@ class MaterializationManifest:
             self.target_root,
             len(self.files),
         )
+        # File records are built inline rather than via
+        # MaterializedFile.to_dict() to avoid a method call and a debug
+        # log record per file on large manifests.
+        files_payload = [
+            {
+                "path": f.path_str,
+                "source_action_id": f.source_action_id,
+                "role": f.role,
+                "layout_metadata": dict(f.layout_metadata),
+            }
+            for f in self.files
+        ]
         return {
             "target_root": str(self.target_root),
-            "files": [f.to_dict() for f in self.files],
+            "files": files_payload,
             "metadata": dict(self.metadata),
         }
 
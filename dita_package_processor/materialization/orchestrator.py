@@ -43,6 +43,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Optional, Protocol
@@ -208,15 +209,26 @@ class MaterializationOrchestrator:
         self.plan = plan
         self.target_root = target_root.resolve()
 
+        # Lifecycle records carry target_root as a structured attribute
+        # (record.target_root) bound once here, so handlers can filter or
+        # index on it without parsing messages.
+        self._log = logging.LoggerAdapter(
+            LOGGER, {"target_root": str(self.target_root)}
+        )
+
         self.validator: Validator = validator or NoOpValidator()
         self.manifest_writer: ManifestWriter = manifest_writer or NoOpManifestWriter()
 
         # Derive concrete artifacts once. This is deterministic and used for both
         # collision detection and manifest construction.
-        self._derived_artifacts: List[TargetArtifact] = self._derive_target_artifacts()
+        self._derived_artifacts: List[TargetArtifact] = self._derive_target_artifacts(
+            self.plan, self.target_root
+        )
 
         # Build a manifest now (deterministic, no I/O).
-        self.manifest = self._build_manifest()
+        self.manifest = self._build_manifest(
+            self.plan, self.target_root, artifacts=self._derived_artifacts
+        )
 
         # Builder may require a manifest kwarg. If caller did not inject one,
         # create a compatible default builder.
@@ -256,32 +268,42 @@ class MaterializationOrchestrator:
         MaterializationOrchestrationError
             If any preflight stage fails.
         """
-        LOGGER.info("MATERIALIZATION PREFLIGHT START target_root=%s", self.target_root)
-        LOGGER.debug(
-            "Preflight inputs: actions=%d derived_artifacts=%d",
-            len(getattr(self.plan, "actions", [])),
-            len(self._derived_artifacts),
-        )
+        self._log.info("MATERIALIZATION PREFLIGHT START target_root=%s", self.target_root)
+
+        # Resolve the DEBUG level once; per-step diagnostics below compute
+        # their arguments eagerly, so skip them entirely when filtered out.
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            LOGGER.debug(
+                "Preflight inputs: actions=%d derived_artifacts=%d",
+                len(getattr(self.plan, "actions", [])),
+                len(self._derived_artifacts),
+            )
 
         try:
             # 1) Prepare filesystem destination (no content mutation).
-            LOGGER.debug("Preflight step: builder.build() using %s", type(self.builder).__name__)
+            if debug:
+                LOGGER.debug("Preflight step: builder.build() using %s", type(self.builder).__name__)
             self.builder.build()
 
             # 2) Validate semantic preflight invariants (optional extension point).
-            LOGGER.debug("Preflight step: validator.validate_preflight() using %s", type(self.validator).__name__)
+            if debug:
+                LOGGER.debug("Preflight step: validator.validate_preflight() using %s", type(self.validator).__name__)
             self.validator.validate_preflight()
 
             # 3) Detect collisions among planned outputs.
-            LOGGER.debug(
-                "Preflight step: collision_detector.detect() using %s (artifacts=%d)",
-                type(self.collision_detector).__name__,
-                len(self._derived_artifacts),
-            )
+            if debug:
+                LOGGER.debug(
+                    "Preflight step: collision_detector.detect() using %s (artifacts=%d)",
+                    type(self.collision_detector).__name__,
+                    len(self._derived_artifacts),
+                )
             self.collision_detector.detect()
 
             # 4) Optional manifest emission (deterministic, safe).
-            LOGGER.debug("Preflight step: manifest_writer.write_preflight() using %s", type(self.manifest_writer).__name__)
+            if debug:
+                LOGGER.debug("Preflight step: manifest_writer.write_preflight() using %s", type(self.manifest_writer).__name__)
             self.manifest_writer.write_preflight()
 
         except (
@@ -291,10 +313,10 @@ class MaterializationOrchestrator:
             ValueError,
             TypeError,
         ) as exc:
-            LOGGER.error("MATERIALIZATION PREFLIGHT FAILED: %s", exc, exc_info=True)
+            self._log.error("MATERIALIZATION PREFLIGHT FAILED: %s", exc, exc_info=True)
             raise MaterializationOrchestrationError(str(exc)) from exc
 
-        LOGGER.info("MATERIALIZATION PREFLIGHT COMPLETE")
+        self._log.info("MATERIALIZATION PREFLIGHT COMPLETE")
 
     # ------------------------------------------------------------------
     # Phase 2: Finalize (POST-EXECUTION)
@@ -317,7 +339,7 @@ class MaterializationOrchestrator:
         MaterializationOrchestrationError
             If finalization fails.
         """
-        LOGGER.info("MATERIALIZATION FINALIZE START")
+        self._log.info("MATERIALIZATION FINALIZE START")
         LOGGER.debug(
             "Finalize inputs: execution_id=%s results=%d",
             getattr(execution_report, "execution_id", "<unknown>"),
@@ -327,27 +349,51 @@ class MaterializationOrchestrator:
         try:
             self.manifest_writer.write_final(execution_report=execution_report)
         except Exception as exc:  # noqa: BLE001
-            LOGGER.error("MATERIALIZATION FINALIZE FAILED: %s", exc, exc_info=True)
+            self._log.error("MATERIALIZATION FINALIZE FAILED: %s", exc, exc_info=True)
             raise MaterializationOrchestrationError(str(exc)) from exc
 
-        LOGGER.info("MATERIALIZATION FINALIZE COMPLETE")
+        self._log.info("MATERIALIZATION FINALIZE COMPLETE")
 
     # ------------------------------------------------------------------
     # Internal: manifest + builder wiring
     # ------------------------------------------------------------------
 
-    def _build_manifest(self) -> Any:
+    @staticmethod
+    def _build_manifest(
+        plan: Plan,
+        target_root: Path,
+        *,
+        artifacts: Optional[List[TargetArtifact]] = None,
+    ) -> Any:
         """
         Build a deterministic materialization manifest.
 
+        The manifest is a pure function of ``(plan, target_root)``, so it can
+        be recomputed without constructing an orchestrator.
+
         If a first-party manifest class exists in the codebase, it can be used.
         Otherwise, this falls back to a local minimal MaterializationManifest.
 
+        Parameters
+        ----------
+        plan:
+            Plan whose actions define the target artifacts.
+        target_root:
+            Target root directory (resolved before use).
+        artifacts:
+            Pre-derived artifacts, to avoid deriving them twice.
+
         Returns
         -------
         Any
             A manifest object suitable for passing to the builder.
         """
+        target_root = target_root.resolve()
+        if artifacts is None:
+            artifacts = MaterializationOrchestrator._derive_target_artifacts(
+                plan, target_root
+            )
+
         # Try to use a project-native manifest model if it exists, without
         # hard depending on its location/name.
         candidates = [
@@ -362,14 +408,14 @@ class MaterializationOrchestrator:
                 module = __import__(module_name, fromlist=[symbol_name])
                 cls = getattr(module, symbol_name)
                 LOGGER.debug("Using manifest class %s.%s", module_name, symbol_name)
-                return cls(target_root=self.target_root, artifacts=self._derived_artifacts)
+                return cls(target_root=target_root, artifacts=artifacts)
             except Exception:  # noqa: BLE001
                 continue
 
         LOGGER.debug("Using local fallback MaterializationManifest")
         return MaterializationManifest(
-            target_root=self.target_root,
-            artifacts=self._derived_artifacts,
+            target_root=target_root,
+            artifacts=artifacts,
         )
 
     def _make_default_builder(self) -> Builder:
@@ -436,13 +482,23 @@ class MaterializationOrchestrator:
     # Internal: derive resolved target artifacts
     # ------------------------------------------------------------------
 
-    def _derive_target_artifacts(self) -> List[TargetArtifact]:
+    @staticmethod
+    def _derive_target_artifacts(
+        plan: Plan, target_root: Path
+    ) -> List[TargetArtifact]:
         """
         Derive concrete target artifacts from the plan.
 
         This is intentionally conservative and deterministic: it derives
         target paths from explicit plan action targets only.
 
+        Parameters
+        ----------
+        plan:
+            Plan whose actions are mapped.
+        target_root:
+            Resolved target root directory.
+
         Returns
         -------
         list[TargetArtifact]
@@ -451,31 +507,38 @@ class MaterializationOrchestrator:
         Notes
         -----
         If an action target is absolute, it is used as-is.
-        If an action target is relative, it is resolved via TargetLayout.
+        If an action target is relative, it is resolved via TargetLayout
+        using its string fast path.
         """
-        layout = TargetLayout(target_root=self.target_root)
+        layout = TargetLayout(target_root=target_root)
 
         artifacts: List[TargetArtifact] = []
-        actions = getattr(self.plan, "actions", [])
+        actions = getattr(plan, "actions", [])
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
 
+        # Single pass per action: absolute detection, layout validation and
+        # mapping all run on the raw target string, so relative targets never
+        # build an intermediate Path before TargetLayout resolves them.
         for action in actions:
-            target_raw = Path(str(action.target))
-
-            if target_raw.is_absolute():
-                resolved = target_raw
-                LOGGER.debug(
-                    "Action target is absolute; using as-is: action_id=%s target=%s",
-                    action.id,
-                    resolved,
-                )
+            target_raw = str(action.target)
+
+            if os.path.isabs(target_raw):
+                resolved = Path(target_raw)
+                if debug:
+                    LOGGER.debug(
+                        "Action target is absolute; using as-is: action_id=%s target=%s",
+                        action.id,
+                        resolved,
+                    )
             else:
                 resolved = layout.resolve(rel_path=target_raw)
-                LOGGER.debug(
-                    "Resolved relative target: action_id=%s rel=%s resolved=%s",
-                    action.id,
-                    target_raw,
-                    resolved,
-                )
+                if debug:
+                    LOGGER.debug(
+                        "Resolved relative target: action_id=%s rel=%s resolved=%s",
+                        action.id,
+                        target_raw,
+                        resolved,
+                    )
 
             artifacts.append(
                 TargetArtifact(
@@ -487,7 +550,7 @@ class MaterializationOrchestrator:
         LOGGER.debug(
             "Derived %d target artifacts for collision detection (target_root=%s)",
             len(artifacts),
-            self.target_root,
+            target_root,
         )
         return artifacts
 
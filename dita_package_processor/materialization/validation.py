@@ -23,6 +23,8 @@ It exists to fail loudly *before* irreversible work begins.
 from __future__ import annotations
 
 import logging
+import os
+import stat
 from pathlib import Path
 
 from dita_package_processor.planning.models import Plan
@@ -108,7 +110,16 @@ class MaterializationValidator:
         """
         LOGGER.debug("Validating target root: %s", self.target_root)
 
-        if self.target_root.exists() and not self.target_root.is_dir():
+        # One stat() call answers both "exists?" and "is a directory?".
+        # stat (not lstat) keeps symlinks to directories acceptable. Any
+        # OSError (missing, symlink loop, ...) counts as "does not exist",
+        # as ``Path.exists()`` did.
+        try:
+            st = os.stat(self.target_root)
+        except OSError:
+            return
+
+        if not stat.S_ISDIR(st.st_mode):
             raise MaterializationValidationError(
                 f"Target root exists but is not a directory: {self.target_root}"
             )
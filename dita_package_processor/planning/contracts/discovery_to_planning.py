@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Set
 
 import jsonschema
 
@@ -49,6 +51,33 @@ _CLASSIFICATION_ALIASES = {
     "MAIN_MAP": "MAIN",
 }
 
+# Every spelling that normalizes to MAIN, resolved once.
+_MAIN_CLASSIFICATIONS: FrozenSet[str] = frozenset(
+    {"MAIN"}
+    | {
+        alias
+        for alias, target in _CLASSIFICATION_ALIASES.items()
+        if target == "MAIN"
+    }
+)
+
+# Required keys per record kind, checked once per record.
+_DISCOVERY_KEYS: FrozenSet[str] = frozenset(
+    {"artifacts", "relationships", "summary"}
+)
+_ARTIFACT_KEYS: FrozenSet[str] = frozenset({"path", "artifact_type"})
+_RELATIONSHIP_KEYS: FrozenSet[str] = frozenset(
+    {"source", "target", "type", "pattern_id"}
+)
+
+# Per-record error messages. ``context`` is ``artifact[i]`` or
+# ``relationship[i]``; tests and CLI users match on these exact shapes.
+_ERR_MISSING_KEYS = "{context} missing required keys: {missing}"
+_ERR_NOT_OBJECT = "{context} must be an object"
+_ERR_ARTIFACT_TYPE = "{context}.artifact_type invalid: {value}"
+_ERR_METADATA = "{context}.metadata must be object"
+_ERR_INVALID = "{context} invalid: {exc}"
+
 _SCHEMA_PATH = Path(__file__).parent / "planning_input.schema.json"
 
 
@@ -86,7 +115,7 @@ def normalize_discovery_report(discovery: Dict[str, Any]) -> PlanningInput:
 
     _require_keys(
         discovery,
-        {"artifacts", "relationships", "summary"},
+        _DISCOVERY_KEYS,
         context="discovery",
     )
 
@@ -107,15 +136,10 @@ def normalize_discovery_report(discovery: Dict[str, Any]) -> PlanningInput:
     LOGGER.debug("Relationships discovered: %d", len(relationships_raw))
 
     artifacts = _normalize_artifacts(artifacts_raw)
-    artifact_paths = {a.path for a in artifacts}
 
     main_map = _select_main_map(artifacts)
 
     relationships = _normalize_relationships(relationships_raw)
-    _validate_relationship_endpoints(
-        relationships,
-        artifact_paths,
-    )
 
     try:
         planning_input = PlanningInput(
@@ -129,6 +153,12 @@ def normalize_discovery_report(discovery: Dict[str, Any]) -> PlanningInput:
             f"PlanningInput construction failed: {exc}"
         ) from exc
 
+    # Reuse the contract's path index instead of building a second set.
+    _validate_relationship_endpoints(
+        planning_input.relationships,
+        planning_input.artifact_paths,
+    )
+
     _validate_against_schema(planning_input)
 
     LOGGER.info(
@@ -146,27 +176,37 @@ def normalize_discovery_report(discovery: Dict[str, Any]) -> PlanningInput:
 # =============================================================================
 
 
-def _validate_against_schema(planning_input: PlanningInput) -> None:
+@lru_cache(maxsize=1)
+def _schema_validator() -> Any:
     """
-    Validate PlanningInput against JSON Schema.
+    Load the PlanningInput schema and build its validator once.
+
+    ``jsonschema.validate`` re-checks the schema and rebuilds a validator on
+    every call; the compiled validator is reused across normalizations.
     """
-    LOGGER.debug(
-        "Validating PlanningInput against schema: %s",
-        _SCHEMA_PATH,
-    )
+    LOGGER.debug("Loading PlanningInput schema: %s", _SCHEMA_PATH)
 
     with _SCHEMA_PATH.open(encoding="utf-8") as fh:
         schema = json.load(fh)
 
-    try:
-        jsonschema.validate(
-            planning_input.to_dict(),
-            schema,
-        )
-    except jsonschema.ValidationError as exc:
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    return validator_cls(schema)
+
+
+def _validate_against_schema(planning_input: PlanningInput) -> None:
+    """
+    Validate PlanningInput against JSON Schema.
+    """
+    error = jsonschema.exceptions.best_match(
+        _schema_validator().iter_errors(planning_input.to_dict())
+    )
+
+    if error is not None:
         raise PlanningContractError(
-            f"PlanningInput schema violation: {exc.message}"
-        ) from exc
+            f"PlanningInput schema violation: {error.message}"
+        ) from error
 
 
 # =============================================================================
@@ -176,17 +216,23 @@ def _validate_against_schema(planning_input: PlanningInput) -> None:
 
 def _require_keys(
     data: Dict[str, Any],
-    keys: Set[str],
+    keys: FrozenSet[str],
     *,
     context: str,
 ) -> None:
     """
     Ensure required keys exist.
+
+    The common all-present case is a single C-level subset test; the
+    sorted missing-key list is only built for the error message.
     """
+    if keys <= data.keys():
+        return
+
     missing = sorted(k for k in keys if k not in data)
     if missing:
         raise PlanningContractError(
-            f"{context} missing required keys: {missing}"
+            _ERR_MISSING_KEYS.format(context=context, missing=missing)
         )
 
 
@@ -203,15 +249,10 @@ def _normalize_classification(value: Any) -> str | None:
         - "MAIN"
         - None
 
-    Everything else deterministically becomes None.
+    Everything else (including non-string values) deterministically
+    becomes None.
     """
-    if value in (None, "", "NONE"):
-        return None
-
-    if value in _CLASSIFICATION_ALIASES:
-        value = _CLASSIFICATION_ALIASES[value]
-
-    if value == "MAIN":
+    if isinstance(value, str) and value in _MAIN_CLASSIFICATIONS:
         return "MAIN"
 
     return None
@@ -235,12 +276,12 @@ def _normalize_artifacts(
 
         if not isinstance(record, dict):
             raise PlanningContractError(
-                f"{context} must be an object"
+                _ERR_NOT_OBJECT.format(context=context)
             )
 
         _require_keys(
             record,
-            {"path", "artifact_type"},
+            _ARTIFACT_KEYS,
             context=context,
         )
 
@@ -249,7 +290,7 @@ def _normalize_artifacts(
 
         if artifact_type not in ALLOWED_ARTIFACT_TYPES:
             raise PlanningContractError(
-                f"{context}.artifact_type invalid: {artifact_type}"
+                _ERR_ARTIFACT_TYPE.format(context=context, value=artifact_type)
             )
 
         classification = _normalize_classification(
@@ -259,7 +300,7 @@ def _normalize_artifacts(
         metadata = record.get("metadata") or {}
         if not isinstance(metadata, dict):
             raise PlanningContractError(
-                f"{context}.metadata must be object"
+                _ERR_METADATA.format(context=context)
             )
 
         # Carry discovery evidence forward so plugin action emitters can
@@ -270,14 +311,14 @@ def _normalize_artifacts(
 
         try:
             artifact = PlanningArtifact(
-                path=str(path),
+                path=sys.intern(str(path)),
                 artifact_type=str(artifact_type),
                 classification=classification,
                 metadata=metadata,
             )
         except (ValueError, TypeError) as exc:
             raise PlanningContractError(
-                f"{context} invalid: {exc}"
+                _ERR_INVALID.format(context=context, exc=exc)
             ) from exc
 
         artifacts.append(artifact)
@@ -295,23 +336,37 @@ def _select_main_map(
 ) -> str:
     """
     Select exactly one MAIN map.
+
+    Single pass; stops at the second candidate. Classifications are already
+    normalized, so aliases such as ``MAIN_MAP`` arrive here as ``MAIN``.
     """
-    main_maps = [
-        a.path
-        for a in artifacts
-        if a.artifact_type == "map"
-        and a.classification == "MAIN"
-    ]
+    main_map: str | None = None
+
+    for artifact in artifacts:
+        if artifact.classification != "MAIN" or artifact.artifact_type != "map":
+            continue
+
+        if main_map is not None:
+            LOGGER.debug(
+                "MAIN map candidates: %s, %s (stopped at second)",
+                main_map,
+                artifact.path,
+            )
+            raise PlanningContractError(
+                "Exactly one artifact must be classified as MAIN map, "
+                "found more than 1"
+            )
+
+        main_map = artifact.path
 
-    LOGGER.debug("MAIN map candidates: %s", main_maps)
+    LOGGER.debug("MAIN map selected: %s", main_map)
 
-    if len(main_maps) != 1:
+    if main_map is None:
         raise PlanningContractError(
-            "Exactly one artifact must be classified as MAIN map, "
-            f"found {len(main_maps)}"
+            "Exactly one artifact must be classified as MAIN map, found 0"
         )
 
-    return main_maps[0]
+    return main_map
 
 
 # =============================================================================
@@ -332,25 +387,27 @@ def _normalize_relationships(
 
         if not isinstance(record, dict):
             raise PlanningContractError(
-                f"{context} must be an object"
+                _ERR_NOT_OBJECT.format(context=context)
             )
 
         _require_keys(
             record,
-            {"source", "target", "type", "pattern_id"},
+            _RELATIONSHIP_KEYS,
             context=context,
         )
 
+        # Endpoints repeat artifact paths; interning shares one string
+        # object per path so endpoint checks hit the identity fast path.
         try:
             relationship = PlanningRelationship(
-                source=str(record["source"]),
-                target=str(record["target"]),
+                source=sys.intern(str(record["source"])),
+                target=sys.intern(str(record["target"])),
                 rel_type=str(record["type"]),
                 pattern_id=str(record["pattern_id"]),
             )
         except (ValueError, TypeError) as exc:
             raise PlanningContractError(
-                f"{context} invalid: {exc}"
+                _ERR_INVALID.format(context=context, exc=exc)
             ) from exc
 
         relationships.append(relationship)
@@ -364,22 +421,25 @@ def _normalize_relationships(
 
 
 def _validate_relationship_endpoints(
-    relationships: List[PlanningRelationship],
-    artifact_paths: Set[str],
+    relationships: Iterable[PlanningRelationship],
+    artifact_paths: AbstractSet[str],
 ) -> None:
     """
     Ensure relationships reference known artifacts.
+
+    One pass over the relationships with O(1) membership tests against the
+    artifact path index built once by ``PlanningInput``.
     """
-    unknown: List[str] = []
+    unknown: Set[str] = set()
 
     for rel in relationships:
         if rel.source not in artifact_paths:
-            unknown.append(rel.source)
+            unknown.add(rel.source)
         if rel.target not in artifact_paths:
-            unknown.append(rel.target)
+            unknown.add(rel.target)
 
     if unknown:
         raise PlanningContractError(
             "Relationships reference unknown artifacts: "
-            f"{sorted(set(unknown))}"
-        )
\ No newline at end of file
+            f"{sorted(unknown)}"
+        )
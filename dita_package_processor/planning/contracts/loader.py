@@ -14,6 +14,10 @@ No business logic.
 No inference.
 No silent defaults.
 Fail fast on any contract violation.
+
+JSON is parsed with ``orjson`` when it is installed (``pip install
+dita-package-processor[speedups]``) and with the standard library
+otherwise. Both parsers read the raw file bytes.
 """
 
 from __future__ import annotations
@@ -29,6 +33,11 @@ from dita_package_processor.planning.contracts.planning_input import (
     PlanningRelationship,
 )
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -62,7 +71,31 @@ def load_planning_input(path: Path) -> PlanningInput:
     LOGGER.info("Loading PlanningInput contract: %s", path)
 
     payload = _read_json(path)
-    return _hydrate(payload, path)
+    return _hydrate(payload)
+
+
+def hydrate_planning_input(payload: Dict[str, Any]) -> PlanningInput:
+    """
+    Validate and hydrate an already parsed PlanningInput payload.
+
+    This is the in-memory half of :func:`load_planning_input`, for callers
+    that hold the contract as a Python mapping and have no file to read.
+
+    Parameters
+    ----------
+    payload : Dict[str, Any]
+        Parsed planning_input.json content.
+
+    Returns
+    -------
+    PlanningInput
+
+    Raises
+    ------
+    PlanningInputLoadError
+        On any contract violation.
+    """
+    return _hydrate(payload)
 
 
 # =============================================================================
@@ -71,16 +104,30 @@ def load_planning_input(path: Path) -> PlanningInput:
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    """Read and parse JSON file."""
+    """
+    Read and parse JSON file.
+
+    The file is read once as bytes and handed straight to the parser, so
+    no intermediate decoded ``str`` copy of the document is held.
+    """
     try:
-        text = path.read_text(encoding="utf-8")
-        return json.loads(text)
-    except Exception as exc:  # noqa: BLE001
+        data = path.read_bytes()
+    except OSError as exc:
         LOGGER.exception("Failed reading planning_input.json")
+        raise PlanningInputLoadError(
+            f"Failed to read planning_input.json: {path}"
+        ) from exc
+
+    try:
+        if _orjson is not None:
+            return _orjson.loads(data)
+        return json.loads(data)
+    except ValueError as exc:
+        LOGGER.exception("Failed parsing planning_input.json")
         raise PlanningInputLoadError("Invalid planning_input.json") from exc
 
 
-def _hydrate(payload: Dict[str, Any], path: Path) -> PlanningInput:
+def _hydrate(payload: Dict[str, Any]) -> PlanningInput:
     """
     Strictly validate and hydrate contract.
 
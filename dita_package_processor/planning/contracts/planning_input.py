@@ -23,7 +23,7 @@ from __future__ import annotations
 import copy
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, KeysView, Literal, Optional, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ _ALLOWED_ARTIFACT_TYPES = {"map", "topic", "media"}
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanningArtifact:
     """
     Normalized planning artifact.
@@ -81,12 +81,13 @@ class PlanningArtifact:
                 "PlanningArtifact.metadata must be a dictionary"
             )
 
-        LOGGER.debug(
-            "PlanningArtifact validated path=%s type=%s classification=%s",
-            self.path,
-            self.artifact_type,
-            self.classification,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "PlanningArtifact validated path=%s type=%s classification=%s",
+                self.path,
+                self.artifact_type,
+                self.classification,
+            )
 
     # -------------------------------------------------------------------------
     # Serialization
@@ -106,7 +107,7 @@ class PlanningArtifact:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanningRelationship:
     """
     Stable relationship edge used by planning.
@@ -134,12 +135,13 @@ class PlanningRelationship:
         if not self.pattern_id:
             raise ValueError("PlanningRelationship.pattern_id required")
 
-        LOGGER.debug(
-            "PlanningRelationship validated %s -> %s type=%s",
-            self.source,
-            self.target,
-            self.rel_type,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "PlanningRelationship validated %s -> %s type=%s",
+                self.source,
+                self.target,
+                self.rel_type,
+            )
 
     # -------------------------------------------------------------------------
     # Serialization
@@ -159,18 +161,26 @@ class PlanningRelationship:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanningInput:
     """
     Planning input contract root.
 
     This is the ONLY structure planning is allowed to consume.
+
+    ``artifacts`` and ``relationships`` may be passed as lists or tuples and
+    are stored as tuples, so the contract is immutable end to end.
     """
 
     contract_version: str
     main_map: str
-    artifacts: List[PlanningArtifact]
-    relationships: List[PlanningRelationship]
+    artifacts: Tuple[PlanningArtifact, ...]
+    relationships: Tuple[PlanningRelationship, ...]
+    _by_path: Dict[str, PlanningArtifact] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     # -------------------------------------------------------------------------
     # Validation
@@ -183,27 +193,57 @@ class PlanningInput:
         if not isinstance(self.main_map, str) or not self.main_map:
             raise ValueError("PlanningInput.main_map must be non-empty string")
 
-        if not isinstance(self.artifacts, list):
+        if not isinstance(self.artifacts, (list, tuple)):
             raise ValueError("PlanningInput.artifacts must be list")
 
-        if not isinstance(self.relationships, list):
+        if not isinstance(self.relationships, (list, tuple)):
             raise ValueError("PlanningInput.relationships must be list")
 
+        if type(self.artifacts) is not tuple:
+            object.__setattr__(self, "artifacts", tuple(self.artifacts))
+
+        if type(self.relationships) is not tuple:
+            object.__setattr__(self, "relationships", tuple(self.relationships))
+
         if not self.artifacts:
             raise ValueError("PlanningInput.artifacts cannot be empty")
 
+        # First occurrence wins, matching a linear scan of ``artifacts``.
+        by_path: Dict[str, PlanningArtifact] = {}
+        for artifact in self.artifacts:
+            by_path.setdefault(artifact.path, artifact)
+        object.__setattr__(self, "_by_path", by_path)
+
         # NOTE:
         # We intentionally DO NOT enforce that main_map must appear in artifacts.
         # That invariant belongs to discovery.
         # Planner must remain agnostic and deterministic.
 
-        LOGGER.debug(
-            "PlanningInput validated version=%s main_map=%s artifacts=%d relationships=%d",
-            self.contract_version,
-            self.main_map,
-            len(self.artifacts),
-            len(self.relationships),
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "PlanningInput validated version=%s main_map=%s artifacts=%d relationships=%d",
+                self.contract_version,
+                self.main_map,
+                len(self.artifacts),
+                len(self.relationships),
+            )
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def artifact_by_path(self, path: str) -> Optional[PlanningArtifact]:
+        """
+        Return the artifact at ``path``, or None if it is not part of the input.
+
+        O(1); the path index is built once at construction.
+        """
+        return self._by_path.get(path)
+
+    @property
+    def artifact_paths(self) -> KeysView[str]:
+        """Set-like view of all artifact paths (O(1) membership, no copy)."""
+        return self._by_path.keys()
 
     # -------------------------------------------------------------------------
     # Serialization
@@ -36,7 +36,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Dict, Iterable, List, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
@@ -100,6 +100,10 @@ class GraphPlanner:
             self._outgoing[source].append(target)
             self._incoming[target].append(source)
 
+        # The graph is fixed at construction, so the traversal is computed
+        # once and reused by every later ``plan()`` call.
+        self._order: Optional[Tuple[str, ...]] = None
+
         LOGGER.debug(
             "GraphPlanner initialized nodes=%d relationships=%d",
             len(self.nodes),
@@ -114,6 +118,9 @@ class GraphPlanner:
         """
         Produce deterministic traversal order.
 
+        The traversal runs on the first call; later calls return a fresh
+        list built from the memoized order.
+
         Returns
         -------
         List[str]
@@ -123,6 +130,10 @@ class GraphPlanner:
         GraphPlannerError
             If graph is cyclic or ambiguous.
         """
+        if self._order is not None:
+            LOGGER.debug("Reusing dependency plan: %d nodes", len(self._order))
+            return list(self._order)
+
         LOGGER.info("Starting dependency planning")
 
         root = self._select_root()
@@ -134,6 +145,7 @@ class GraphPlanner:
 
         LOGGER.info("Dependency planning complete: %d nodes", len(ordered))
 
+        self._order = tuple(ordered)
         return ordered
 
     # -------------------------------------------------------------------------
@@ -18,17 +18,21 @@ Responsibilities:
 - Remove media artifacts from graph topology
 - Remove edges involving media
 - Ensure graph nodes reference known artifacts
+- Drop duplicate nodes and edges (first occurrence wins)
 - Perform no inference and no guessing
 """
 
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-from typing import Any, Dict, List, Set
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+# Artifact type excluded from planning topology.
+_MEDIA = "media"
+
 
 # ---------------------------------------------------------------------------
 # Path normalization
@@ -40,7 +44,8 @@ def _normalize_path(path: str) -> str:
     Canonicalize a discovery path.
 
     Rules:
-    - Convert to POSIX format
+    - Convert to POSIX format (backslashes become '/')
+    - Collapse repeated '/' and drop '.' segments
     - Strip leading './'
     - No filesystem access
     - No guessing
@@ -51,7 +56,28 @@ def _normalize_path(path: str) -> str:
     if not isinstance(path, str) or not path.strip():
         raise ValueError(f"Invalid artifact path: {path!r}")
 
-    normalized = Path(path).as_posix().lstrip("./")
+    return _canonical_path(path)
+
+
+@lru_cache(maxsize=65536)
+def _canonical_path(path: str) -> str:
+    """
+    Memoized canonicalization of an already validated path.
+
+    The same path is typically seen as an artifact, a graph node and an
+    edge endpoint, so repeats are served from the cache.
+
+    :param path: Non-empty discovery path.
+    :return: Canonicalized path.
+    """
+    # Purely lexical: drop empty and "." segments, as ``Path.as_posix()``
+    # did on POSIX, without building a path object. Backslashes are
+    # converted on every platform. The leading strip is the legacy rule.
+    normalized = "/".join(
+        segment
+        for segment in path.replace("\\", "/").split("/")
+        if segment and segment != "."
+    ).lstrip("./")
     LOGGER.debug("Normalized path: %s → %s", path, normalized)
     return normalized
 
@@ -100,8 +126,13 @@ class PlanningInputNormalizer:
         # Normalize artifacts
         # ------------------------------------------------------------------
 
-        artifacts: List[Dict[str, Any]] = []
-        artifact_index: Dict[str, Dict[str, Any]] = {}
+        # One pass builds the semantic artifact list and the path lookups
+        # used below; node and edge checks are then set/dict probes only.
+        artifact_count = 0
+        semantic_artifacts: List[Dict[str, Any]] = []
+        # Canonical path → "is media", classified once per artifact so the
+        # type string is never compared again after this loop.
+        is_media_by_path: Dict[str, bool] = {}
 
         for idx, artifact in enumerate(raw_artifacts):
             if not isinstance(artifact, dict):
@@ -110,24 +141,30 @@ class PlanningInputNormalizer:
             if "path" not in artifact or "artifact_type" not in artifact:
                 raise ValueError(f"artifact[{idx}] missing required fields")
 
+            # Media paths are still canonicalized: nodes and edges that
+            # reference them must resolve to a known artifact.
             path = _normalize_path(artifact["path"])
+            is_media = artifact["artifact_type"] == _MEDIA
 
-            normalized = dict(artifact)
-            normalized["path"] = path
+            artifact_count += 1
+            is_media_by_path[path] = is_media
 
-            artifacts.append(normalized)
-            artifact_index[path] = normalized
+            # Filter out media artifacts before copying them
+            if is_media:
+                continue
 
-        # Filter out media artifacts
-        semantic_artifacts = [
-            a for a in artifacts if a.get("artifact_type") != "media"
-        ]
+            normalized = dict(artifact)
+            normalized["path"] = path
+            semantic_artifacts.append(normalized)
 
-        semantic_paths: Set[str] = {a["path"] for a in semantic_artifacts}
+        # Last occurrence of a path decides its type, as before.
+        media_paths: FrozenSet[str] = frozenset(
+            path for path, is_media in is_media_by_path.items() if is_media
+        )
 
         LOGGER.debug(
             "Artifacts normalized: total=%d semantic=%d",
-            len(artifacts),
+            artifact_count,
             len(semantic_artifacts),
         )
 
@@ -139,17 +176,21 @@ class PlanningInputNormalizer:
         if not isinstance(raw_nodes, list):
             raise ValueError("discovery.graph.nodes must be a list")
 
-        normalized_nodes: List[str] = []
+        # Insertion-ordered dict keys: duplicates (including paths that only
+        # become equal once canonicalized) collapse without a list scan.
+        node_paths: Dict[str, None] = {}
 
         for node in raw_nodes:
             node_path = _normalize_path(node)
 
-            if node_path not in artifact_index:
+            if node_path not in is_media_by_path:
                 LOGGER.error("Graph node references missing artifact: %s", node_path)
                 raise ValueError(f"Graph node references missing artifact: {node_path}")
 
-            if artifact_index[node_path]["artifact_type"] != "media":
-                normalized_nodes.append(node_path)
+            if node_path not in media_paths:
+                node_paths[node_path] = None
+
+        normalized_nodes: List[str] = list(node_paths)
 
         # ------------------------------------------------------------------
         # Normalize edges
@@ -160,6 +201,7 @@ class PlanningInputNormalizer:
             raise ValueError("discovery.graph.edges must be a list")
 
         normalized_edges: List[Dict[str, Any]] = []
+        seen_edges: Set[Tuple[str, str, Any]] = set()
 
         for idx, edge in enumerate(raw_edges):
             if not isinstance(edge, dict):
@@ -172,15 +214,20 @@ class PlanningInputNormalizer:
             src = _normalize_path(edge["source"])
             tgt = _normalize_path(edge["target"])
 
-            if src not in artifact_index or tgt not in artifact_index:
+            if src not in is_media_by_path or tgt not in is_media_by_path:
                 LOGGER.error("Edge references missing artifact: %s", edge)
                 raise ValueError(f"Edge references missing artifact: {edge}")
 
             # Remove any edges involving media
-            if artifact_index[src]["artifact_type"] == "media":
+            if src in media_paths or tgt in media_paths:
                 continue
-            if artifact_index[tgt]["artifact_type"] == "media":
+
+            # An edge is identified by its endpoints and relationship type.
+            edge_key = (src, tgt, edge.get("type"))
+            if edge_key in seen_edges:
+                LOGGER.debug("Dropping duplicate edge: %s", edge)
                 continue
+            seen_edges.add(edge_key)
 
             normalized_edge = dict(edge)
             normalized_edge["source"] = src
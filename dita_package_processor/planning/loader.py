@@ -14,14 +14,22 @@ This module enforces a *hard boundary* between:
 
 No semantic validation, execution logic, or fallback behavior is allowed here.
 All failures are fatal and must abort the pipeline.
+
+JSON is parsed with ``orjson`` when it is installed (``pip install
+dita-package-processor[speedups]``) and with the standard library
+otherwise. Both parsers read the raw file bytes.
+
+``load_plan`` also accepts an open binary file object (for example an
+``io.BytesIO``), in which case nothing is read from the filesystem.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Union
 
 from dita_package_processor.planning.hydrator import (
     PlanHydrationError,
@@ -29,8 +37,15 @@ from dita_package_processor.planning.hydrator import (
 )
 from dita_package_processor.planning.models import Plan
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+PlanSource = Union[str, "os.PathLike[str]", BinaryIO]
+
 
 class PlanLoadError(ValueError):
     """
@@ -43,31 +58,33 @@ class PlanLoadError(ValueError):
     """
 
 
-def load_plan(path: Path) -> Plan:
+def load_plan(path: PlanSource) -> Plan:
     """
     Load and hydrate a ``plan.json`` file.
 
     Strict process:
-        1. Read UTF-8 JSON text from disk
-        2. Parse JSON into a Python mapping
+        1. Read the raw bytes from disk (or from the given file object)
+        2. Parse UTF-8 JSON into a Python mapping
         3. Hydrate mapping into a :class:`Plan`
 
     No optional behavior, no guessing, no silent recovery.
 
-    :param path: Path to the ``plan.json`` file.
+    :param path: Path (``str`` or path-like) to the ``plan.json`` file,
+        or an open binary file object positioned at the start of the plan.
     :return: Fully hydrated :class:`Plan` instance.
     :raises PlanLoadError: If any step fails.
     """
-    LOGGER.info("Loading execution plan from %s", path)
+    label = _describe(path)
+    LOGGER.info("Loading execution plan from %s", label)
 
-    raw_text = _read_file(path)
-    payload = _parse_json(raw_text, path)
-    plan = _hydrate(payload, path)
+    raw = _read_file(path)
+    payload = _parse_json(raw, label)
+    plan = _hydrate(payload, label)
 
     LOGGER.info(
         "Plan successfully loaded: version=%s path=%s",
         plan.plan_version,
-        path,
+        label,
     )
     return plan
 
@@ -76,41 +93,68 @@ def load_plan(path: Path) -> Plan:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _read_file(path: Path) -> str:
+def _describe(path: PlanSource) -> str:
     """
-    Read plan file from disk.
+    Return a printable source name for logs and error messages.
+
+    :param path: File path or binary file object.
+    :return: The path, the file object's ``name``, or ``"<stream>"``.
+    """
+    if isinstance(path, (str, os.PathLike)):
+        return os.fspath(path)
+    return str(getattr(path, "name", "<stream>"))
+
 
-    :param path: File path.
-    :return: File contents as string.
+def _read_file(path: PlanSource) -> bytes:
+    """
+    Read plan file from disk, or from an open binary file object.
+
+    The bytes are handed straight to the parser, so no intermediate
+    decoded ``str`` copy of the document is held.
+
+    :param path: File path or binary file object.
+    :return: Raw file contents.
     :raises PlanLoadError: If file cannot be read.
     """
     try:
-        text = path.read_text(encoding="utf-8")
-        LOGGER.debug("Read %d bytes from plan file: %s", len(text), path)
-        return text
+        if hasattr(path, "read"):
+            data = path.read()
+        else:
+            data = Path(path).read_bytes()
+        LOGGER.debug(
+            "Read %d bytes from plan file: %s",
+            len(data),
+            _describe(path),
+        )
+        return data
     except Exception as exc:  # noqa: BLE001
         LOGGER.error(
             "Failed to read plan file: %s",
-            path,
+            _describe(path),
             exc_info=True,
         )
-        raise PlanLoadError(f"Failed to read plan file: {path}") from exc
+        raise PlanLoadError(
+            f"Failed to read plan file: {_describe(path)}"
+        ) from exc
 
 
-def _parse_json(raw_text: str, path: Path) -> Dict[str, Any]:
+def _parse_json(raw: bytes, path: str) -> Dict[str, Any]:
     """
     Parse JSON payload.
 
-    :param raw_text: Raw JSON string.
-    :param path: Source file path (for error context).
+    :param raw: Raw UTF-8 encoded JSON bytes.
+    :param path: Source name (for error context).
     :return: Parsed JSON mapping.
-    :raises PlanLoadError: If JSON is invalid.
+    :raises PlanLoadError: If JSON is invalid or not valid UTF-8.
     """
     try:
-        payload = json.loads(raw_text)
+        if _orjson is not None:
+            payload = _orjson.loads(raw)
+        else:
+            payload = json.loads(raw)
         LOGGER.debug("Parsed JSON successfully from %s", path)
         return payload
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         LOGGER.error(
             "Invalid JSON in plan file: %s",
             path,
@@ -119,12 +163,12 @@ def _parse_json(raw_text: str, path: Path) -> Dict[str, Any]:
         raise PlanLoadError(f"Invalid JSON in plan file: {path}") from exc
 
 
-def _hydrate(payload: Dict[str, Any], path: Path) -> Plan:
+def _hydrate(payload: Dict[str, Any], path: str) -> Plan:
     """
     Hydrate JSON payload into a Plan model.
 
     :param payload: Parsed JSON mapping.
-    :param path: Source file path (for error context).
+    :param path: Source name (for error context).
     :return: Hydrated Plan.
     :raises PlanLoadError: If hydration fails.
     """
@@ -77,7 +77,10 @@ class Planner:
 
         LOGGER.info("Starting plan generation")
 
-        if not isinstance(planning_input, PlanningInput):
+        # Exact-type fast path; isinstance only runs for other types.
+        if type(planning_input) is not PlanningInput and not isinstance(
+            planning_input, PlanningInput
+        ):
             raise TypeError(
                 "Planner.plan() requires PlanningInput instance"
             )
@@ -2,13 +2,306 @@
 Shared pytest configuration and fixtures.
 """
 
+from __future__ import annotations
+
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterator
+from unittest.mock import MagicMock
+
 import pytest
 
+# Package modules are imported inside the fixtures that need them so that
+# collecting unrelated test directories does not import the pipeline stack.
+if TYPE_CHECKING:
+    from dita_package_processor.execution.models import ExecutionReport
+
+
+# =============================================================================
+# Opt-in benchmarks
+# =============================================================================
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """
+    Register ``--run-perf`` to include ``perf``-marked benchmarks.
+    """
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=False,
+        help="run throughput benchmarks marked 'perf'",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """
+    Skip ``perf``-marked tests unless ``--run-perf`` was given.
+    """
+    if config.getoption("--run-perf"):
+        return
+
+    skip_perf = pytest.mark.skip(reason="benchmark; use --run-perf to run")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
 
 @pytest.fixture
 def project_root() -> Path:
     """
     Return the project root directory.
     """
-    return Path(__file__).resolve().parents[1]
\ No newline at end of file
+    return Path(__file__).resolve().parents[1]
+
+
+# =============================================================================
+# Pipeline fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def minimal_package(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Write a minimal DITA package (index map referencing a main map).
+
+    The package is written once per session and shared. It is read-only
+    input: tests direct any output to their own ``tmp_path``.
+
+    :return: Package root directory.
+    """
+    root = tmp_path_factory.mktemp("pkg")
+
+    (root / "index.ditamap").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<map>
+  <mapref href="main.ditamap"/>
+</map>
+""",
+        encoding="utf-8",
+    )
+
+    (root / "main.ditamap").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<map>
+  <title>Main</title>
+</map>
+""",
+        encoding="utf-8",
+    )
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def fake_inventory() -> SimpleNamespace:
+    """
+    Minimal DiscoveryInventory-shaped object that satisfies the
+    Pipeline MAIN map invariant.
+
+    Built once per session; the pipeline only reads it. A test that needs
+    to change it must work on a ``copy.deepcopy``.
+
+    Pipeline requires exactly one artifact where:
+        artifact_type == "map"
+        classification == MapType.MAIN
+
+    The enum is used directly (never the legacy "MAIN_MAP" alias) so no
+    test depends on string-to-enum coercion.
+    """
+    from dita_package_processor.knowledge.map_types import MapType
+
+    main_map = SimpleNamespace(
+        artifact_type="map",
+        classification=MapType.MAIN,
+        path="main.ditamap",
+    )
+    assert isinstance(main_map.classification, MapType)
+
+    return SimpleNamespace(
+        artifacts=[main_map],
+        graph=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def minimal_plan() -> Dict[str, Any]:
+    """
+    Return minimal plan dict matching planner contract.
+
+    Built once per session and shared; treat it as read-only (copy it
+    before mutating).
+    """
+    return {
+        "plan_version": 1,
+        "generated_at": "2026-01-30T00:00:00+00:00",
+        "source_discovery": {
+            "path": "discovery.json",
+            "schema_version": 1,
+            "artifact_count": 1,
+        },
+        "intent": {},
+        "actions": [],
+        "invariants": [],
+    }
+
+
+@pytest.fixture
+def fake_plan_path() -> Path:
+    """
+    Return a plan path that is never read.
+
+    ``mocked_pipeline`` replaces ``load_plan``, so no file needs to exist.
+    """
+    return Path("plan.json")
+
+
+def _make_fake_report(*, dry_run: bool) -> ExecutionReport:
+    """
+    Build a deterministic fake execution report with one action result.
+    """
+    from dita_package_processor.execution.models import (
+        ExecutionActionResult,
+        ExecutionReport,
+    )
+
+    result = ExecutionActionResult(
+        action_id="a1",
+        status="skipped" if dry_run else "success",
+        handler="DryRunExecutor" if dry_run else "FilesystemExecutor",
+        dry_run=dry_run,
+        message="simulated",
+    )
+
+    return ExecutionReport.create(
+        execution_id="pipeline-execution",
+        dry_run=dry_run,
+        results=[result],
+    )
+
+
+@pytest.fixture(scope="session")
+def dry_run_report() -> ExecutionReport:
+    """
+    Return the shared fake report of a dry run.
+
+    Built once per session; tests only read it.
+    """
+    return _make_fake_report(dry_run=True)
+
+
+@pytest.fixture(scope="session")
+def apply_run_report() -> ExecutionReport:
+    """
+    Return the shared fake report of an applied run.
+
+    Built once per session; tests only read it.
+    """
+    return _make_fake_report(dry_run=False)
+
+
+class _Spy:
+    """
+    Minimal call-recording callable.
+
+    Records ``(args, kwargs)`` per call. If ``side_effect`` is set to an
+    exception it is raised after recording, mirroring ``MagicMock``.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], Dict[str, Any]]] = []
+        self.side_effect: BaseException | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+
+
+class _Orchestrator:
+    """MaterializationOrchestrator stand-in with spied lifecycle hooks."""
+
+    def __init__(self) -> None:
+        self.preflight = _Spy()
+        self.finalize = _Spy()
+
+
+@contextmanager
+def _patch_attrs(target: Any, **overrides: Any) -> Iterator[None]:
+    """
+    Temporarily replace attributes of ``target``.
+
+    Originals are saved in one dict and restored on exit, so callers may
+    also reassign the same attributes inside the block.
+    """
+    saved = {name: getattr(target, name) for name in overrides}
+
+    for name, value in overrides.items():
+        setattr(target, name, value)
+
+    try:
+        yield
+    finally:
+        for name, original in saved.items():
+            setattr(target, name, original)
+
+
+@pytest.fixture
+def mocked_pipeline(
+    fake_inventory: SimpleNamespace,
+    minimal_plan: Dict[str, Any],
+    dry_run_report: ExecutionReport,
+    apply_run_report: ExecutionReport,
+) -> Iterator[SimpleNamespace]:
+    """
+    Replace every phase collaborator of ``dita_package_processor.pipeline``.
+
+    Patched:
+    - run_discovery → returns ``fake_inventory``
+    - run_planning → returns ``minimal_plan``
+    - load_plan → returns ``minimal_plan``
+    - MaterializationOrchestrator → returns ``handle.orchestrator``, a
+      lightweight spy exposing ``preflight.calls`` and ``finalize.calls``
+    - get_executor → records the mode, returns ``handle.executor`` whose
+      ``run`` returns ``apply_run_report`` or ``dry_run_report`` to match
+      the requested apply flag
+
+    The originals are saved once and restored on teardown, so tests may
+    also assign replacements to the module directly without monkeypatch.
+
+    Tests override only what they need, e.g.
+    ``handle.orchestrator.preflight.side_effect = ...``.
+
+    :return: Handle exposing ``orchestrator``, ``executor`` and
+        ``selected_modes``.
+    """
+    import dita_package_processor.pipeline as pipeline_module
+    from dita_package_processor.execution.models import ExecutionReport
+
+    handle = SimpleNamespace(
+        orchestrator=_Orchestrator(),
+        executor=MagicMock(),
+        selected_modes=[],
+    )
+
+    def _get_executor(name: str, *, apply: bool, **_: Any) -> Any:
+        handle.selected_modes.append(name)
+        if not isinstance(handle.executor.run.return_value, ExecutionReport):
+            handle.executor.run.return_value = (
+                apply_run_report if apply else dry_run_report
+            )
+        return handle.executor
+
+    with _patch_attrs(
+        pipeline_module,
+        run_discovery=lambda **_: fake_inventory,
+        run_planning=lambda **_: minimal_plan,
+        load_plan=lambda _: minimal_plan,
+        MaterializationOrchestrator=lambda **_: handle.orchestrator,
+        get_executor=_get_executor,
+    ):
+        yield handle
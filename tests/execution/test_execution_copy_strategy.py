@@ -0,0 +1,127 @@
+"""
+Tests for copy strategy selection.
+
+Every strategy must behave like ``shutil.copy2`` regardless of which
+kernel facility (if any) is available on the host running the tests.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from dita_package_processor.execution import copy_strategy
+from dita_package_processor.execution.copy_strategy import select_copy_impl
+
+
+@pytest.mark.parametrize(
+    "impl",
+    [
+        copy_strategy._copy_portable,
+        copy_strategy._copy_reflink,
+        copy_strategy._copy_file_range_or_portable,
+    ],
+)
+def test_strategies_copy_content_and_mode(tmp_path: Path, impl) -> None:
+    if impl is copy_strategy._copy_reflink:
+        pytest.importorskip("fcntl")
+
+    source = tmp_path / "src.bin"
+    target = tmp_path / "dst.bin"
+    source.write_bytes(b"x" * 70_000)
+    source.chmod(0o640)
+
+    impl(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+    assert os.stat(target).st_mode == os.stat(source).st_mode
+
+
+@pytest.mark.parametrize(
+    "impl",
+    [
+        copy_strategy._copy_portable,
+        copy_strategy._copy_reflink,
+        copy_strategy._copy_file_range,
+    ],
+)
+def test_strategies_refuse_to_copy_file_onto_itself(
+    tmp_path: Path, impl
+) -> None:
+    if impl is copy_strategy._copy_reflink:
+        pytest.importorskip("fcntl")
+
+    source = tmp_path / "same.bin"
+    source.write_bytes(b"payload")
+
+    with pytest.raises(shutil.SameFileError):
+        impl(source, tmp_path / "." / "same.bin")
+
+    assert source.read_bytes() == b"payload"
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range"
+)
+def test_copy_file_range_recopies_after_short_copy(
+    tmp_path: Path, monkeypatch
+) -> None:
+    real_copy_file_range = os.copy_file_range
+    calls: list[int] = []
+
+    def _short(src: int, dst: int, count: int) -> int:
+        # First call copies part of the file, then the kernel reports EOF.
+        calls.append(count)
+        if len(calls) == 1:
+            return real_copy_file_range(src, dst, 10)
+        return 0
+
+    monkeypatch.setattr(os, "copy_file_range", _short)
+
+    source = tmp_path / "src.bin"
+    target = tmp_path / "dst.bin"
+    source.write_bytes(b"y" * 70_000)
+
+    copy_strategy._copy_file_range(source, target)
+
+    assert len(calls) == 2
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_select_copy_impl_is_callable_for_sandbox_root(tmp_path: Path) -> None:
+    impl = select_copy_impl(tmp_path.resolve())
+
+    source = tmp_path / "a.txt"
+    source.write_text("hello", encoding="utf-8")
+    impl(source, tmp_path / "b.txt")
+
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_selection_prefers_reflink_on_cow_filesystems(monkeypatch) -> None:
+    monkeypatch.setattr(copy_strategy.sys, "platform", "linux")
+    copy_strategy._select_for.cache_clear()
+
+    try:
+        assert (
+            copy_strategy._select_for("btrfs", (6, 1))
+            is copy_strategy._copy_reflink
+        )
+    finally:
+        copy_strategy._select_for.cache_clear()
+
+
+def test_selection_is_portable_off_linux(monkeypatch) -> None:
+    monkeypatch.setattr(copy_strategy.sys, "platform", "darwin")
+    copy_strategy._select_for.cache_clear()
+
+    try:
+        assert (
+            copy_strategy._select_for("apfs", (0, 0))
+            is copy_strategy._copy_portable
+        )
+    finally:
+        copy_strategy._select_for.cache_clear()
@@ -19,7 +19,10 @@ from typing import Any, Dict
 import pytest
 
 from dita_package_processor.execution.dry_run_executor import DryRunExecutor
-from dita_package_processor.execution.models import ExecutionActionResult
+from dita_package_processor.execution.models import (
+    ExecutionActionResult,
+    ExecutionReport,
+)
 
 
 # =============================================================================
@@ -37,8 +40,7 @@ def dry_run_executor() -> DryRunExecutor:
     return DryRunExecutor()
 
 
-@pytest.fixture
-def simple_plan() -> Dict[str, Any]:
+def _simple_plan() -> Dict[str, Any]:
     """
     Minimal valid execution plan.
 
@@ -55,24 +57,40 @@ def simple_plan() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def simple_plan() -> Dict[str, Any]:
+    """Fresh copy of the minimal plan for tests that run it themselves."""
+    return _simple_plan()
+
+
+@pytest.fixture(scope="module")
+def shared_dry_run_report() -> ExecutionReport:
+    """
+    Run the minimal plan once and share the report.
+
+    Dry-run execution is a pure function of the plan, so the read-only
+    report checks below do not need a run each.
+    """
+    return DryRunExecutor().run(
+        execution_id="exec-dry-shared",
+        plan=_simple_plan(),
+    )
+
+
 # =============================================================================
 # Tests
 # =============================================================================
 
 
 def test_dry_run_executor_produces_execution_report(
-    dry_run_executor: DryRunExecutor,
-    simple_plan: Dict[str, Any],
+    shared_dry_run_report: ExecutionReport,
 ) -> None:
     """
     Running a dry-run plan must emit a valid ExecutionReport.
     """
-    report = dry_run_executor.run(
-        execution_id="exec-dry-001",
-        plan=simple_plan,
-    )
+    report = shared_dry_run_report
 
-    assert report.execution_id == "exec-dry-001"
+    assert report.execution_id == "exec-dry-shared"
     assert report.dry_run is True
     assert len(report.results) == 2
 
@@ -83,18 +101,12 @@ def test_dry_run_executor_produces_execution_report(
 
 
 def test_dry_run_executor_produces_skipped_results(
-    dry_run_executor: DryRunExecutor,
-    simple_plan: Dict[str, Any],
+    shared_dry_run_report: ExecutionReport,
 ) -> None:
     """
     Every action must produce a skipped dry-run result.
     """
-    report = dry_run_executor.run(
-        execution_id="exec-dry-002",
-        plan=simple_plan,
-    )
-
-    for result in report.results:
+    for result in shared_dry_run_report.results:
         assert isinstance(result, ExecutionActionResult)
         assert result.dry_run is True
         assert result.status == "skipped"
@@ -60,4 +60,25 @@ def test_resolve_rejects_traversal_attempt(tmp_path: Path) -> None:
     traversal = Path("../escape.txt")
 
     with pytest.raises(SandboxViolationError):
-        sandbox.resolve(traversal)
\ No newline at end of file
+        sandbox.resolve(traversal)
+
+
+def test_ensure_parent_creates_directory_once(tmp_path: Path, monkeypatch) -> None:
+    sandbox = Sandbox(tmp_path)
+    calls: list[Path] = []
+    real_mkdir = Path.mkdir
+
+    def _recording_mkdir(self: Path, *args, **kwargs) -> None:
+        calls.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _recording_mkdir)
+
+    first = sandbox.resolve(Path("out/a.txt"))
+    second = sandbox.resolve(Path("out/b.txt"))
+
+    assert sandbox.ensure_parent(first) == first.parent
+    sandbox.ensure_parent(second)
+
+    assert first.parent.is_dir()
+    assert calls == [first.parent]
@@ -0,0 +1,129 @@
+"""
+Materialization test fixtures.
+
+Collaborator fakes and filesystem helpers are provided as fixtures so
+tests do not import helper modules by bare name.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+
+
+def _noop(*_args: Any, **_kwargs: Any) -> None:
+    return None
+
+
+class NullCollaborator:
+    """
+    Collaborator whose every method is a no-op returning ``None``.
+
+    Satisfies the Builder, Validator, CollisionDetectorProtocol and
+    ManifestWriter protocols without recording calls. ``MagicMock`` records
+    every call and auto-creates child mocks; tests that never assert on
+    collaborator calls use this instead.
+    """
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _noop
+
+
+class CallCounter:
+    """
+    Callable that only counts invocations.
+
+    A cheap stand-in for ``MagicMock().method`` when a test or benchmark
+    needs a call count but not call arguments.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+
+    def __call__(self, *_args: Any, **_kwargs: Any) -> None:
+        self.n += 1
+        return None
+
+
+class FakeBuilder:
+    """Builder whose ``build`` is a :class:`CallCounter`."""
+
+    def __init__(self) -> None:
+        self.build = CallCounter()
+
+
+class FakeValidator:
+    """Validator whose ``validate_preflight`` is a :class:`CallCounter`."""
+
+    def __init__(self) -> None:
+        self.validate_preflight = CallCounter()
+
+
+class FakeCollisionDetector:
+    """Collision detector whose ``detect`` is a :class:`CallCounter`."""
+
+    def __init__(self) -> None:
+        self.detect = CallCounter()
+
+
+class FakeManifestWriter:
+    """Manifest writer whose hooks are :class:`CallCounter` instances."""
+
+    def __init__(self) -> None:
+        self.write_preflight = CallCounter()
+        self.write_final = CallCounter()
+
+
+@pytest.fixture
+def null_collaborator() -> NullCollaborator:
+    """
+    Return a stateless collaborator that may fill any orchestrator role.
+    """
+    return NullCollaborator()
+
+
+@pytest.fixture
+def counting_collaborators() -> SimpleNamespace:
+    """
+    Return fresh counter-based orchestrator collaborators.
+
+    :return: Namespace with ``builder``, ``validator``,
+        ``collision_detector`` and ``manifest_writer``.
+    """
+    return SimpleNamespace(
+        builder=FakeBuilder(),
+        validator=FakeValidator(),
+        collision_detector=FakeCollisionDetector(),
+        manifest_writer=FakeManifestWriter(),
+    )
+
+
+def _fast_write(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``path``, creating or truncating the file.
+
+    Raw ``os`` calls with pre-encoded bytes skip ``Path.write_text``'s
+    per-call text-layer setup in tests that create many small files.
+
+    :param path: Destination file path.
+    :param data: Pre-encoded file content.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture
+def fast_write() -> Callable[[Path, bytes], None]:
+    """
+    Return a writer for fixture files: ``fast_write(path, data)``.
+    """
+    return _fast_write
@@ -21,6 +21,7 @@ If this test fails:
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable
 
 from dita_package_processor.execution.executors.filesystem import (
     FilesystemExecutor,
@@ -57,7 +58,10 @@ def _make_copy_plan(source: Path, target: Path) -> dict:
 # -----------------------------------------------------------------------------
 
 
-def test_filesystem_executor_copies_file(tmp_path: Path) -> None:
+def test_filesystem_executor_copies_file(
+    tmp_path: Path,
+    fast_write: Callable[[Path, bytes], None],
+) -> None:
     """
     FilesystemExecutor should physically copy a file using handlers.
 
@@ -73,7 +77,7 @@ def test_filesystem_executor_copies_file(tmp_path: Path) -> None:
     source = source_root / "source.txt"
     target = sandbox_root / "target.txt"
 
-    source.write_text("hello world", encoding="utf-8")
+    fast_write(source, b"hello world")
 
     executor = FilesystemExecutor(
         source_root=source_root,
@@ -88,4 +88,34 @@ def test_allows_existing_target_directory(tmp_path: Path) -> None:
     )
 
     # Should not raise
-    validator.validate()
\ No newline at end of file
+    validator.validate()
+
+
+def test_allows_symlink_to_target_directory(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+
+    validator = MaterializationValidator(
+        plan=_plan_with_actions(),
+        target_root=link,
+    )
+
+    # Should not raise
+    validator.validate()
+
+
+def test_symlink_loop_target_is_treated_as_missing(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.symlink_to(second)
+    second.symlink_to(first)
+
+    validator = MaterializationValidator(
+        plan=_plan_with_actions(),
+        target_root=first,
+    )
+
+    # Should not raise: an unresolvable root is "not there yet"
+    validator.validate()
@@ -10,6 +10,8 @@ These tests validate that layout mapping is:
 No filesystem mutation is required for these tests.
 """
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -33,6 +35,53 @@ def test_rejects_path_traversal(tmp_path: Path) -> None:
         layout.resolve(rel_path=Path("../evil.dita"))
 
 
+@pytest.mark.parametrize(
+    "rel_path",
+    [
+        "/etc/passwd",
+        "a/../../evil.dita",
+        "",
+    ],
+)
+def test_rejects_unsafe_string_paths(tmp_path: Path, rel_path: str) -> None:
+    layout = TargetLayout(target_root=tmp_path)
+    with pytest.raises(LayoutError):
+        layout.resolve(rel_path=rel_path)
+
+
+@pytest.mark.skipif(os.name != "nt", reason="Windows path semantics")
+@pytest.mark.parametrize(
+    "rel_path",
+    [
+        "\\\\server\\share.dita",
+        "C:/evil.dita",
+        "a\\..\\b.dita",
+    ],
+)
+def test_rejects_unsafe_windows_paths(tmp_path: Path, rel_path: str) -> None:
+    layout = TargetLayout(target_root=tmp_path)
+    with pytest.raises(LayoutError):
+        layout.resolve(rel_path=rel_path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX path semantics")
+@pytest.mark.parametrize("rel_path", ["a:b.dita", "a\\..\\b.dita"])
+def test_posix_allows_colons_and_backslashes(
+    tmp_path: Path, rel_path: str
+) -> None:
+    layout = TargetLayout(target_root=tmp_path)
+
+    assert layout.resolve(rel_path=rel_path) == tmp_path / "topics" / rel_path
+
+
+def test_string_paths_resolve_like_path_objects(tmp_path: Path) -> None:
+    layout = TargetLayout(target_root=tmp_path)
+
+    assert layout.resolve(rel_path="images/icons/x.svg") == layout.resolve(
+        rel_path=Path("images/icons/x.svg")
+    )
+
+
 def test_maps_are_flattened_to_target_root(tmp_path: Path) -> None:
     layout = TargetLayout(target_root=tmp_path)
 
@@ -100,4 +149,65 @@ def test_custom_policy_can_be_injected(tmp_path: Path) -> None:
     layout = TargetLayout(target_root=tmp_path, policy=_Policy())
 
     out = layout.resolve(rel_path=Path("topics/a.dita"))
-    assert out == tmp_path / "media" / "a.dita"
\ No newline at end of file
+    assert out == tmp_path / "media" / "a.dita"
+
+
+def test_frozen_policy_mapping_is_memoized(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    @dataclass(frozen=True)
+    class _FrozenPolicy:
+        # Unique per test run: the mapping cache is module-level.
+        tag: str
+
+        def map_relative_path(self, rel_path: Path) -> Path:
+            calls.append(self.tag)
+            return Path("media") / rel_path.name
+
+    layout = TargetLayout(
+        target_root=tmp_path, policy=_FrozenPolicy(str(tmp_path))
+    )
+
+    layout.resolve(rel_path=Path("assets/logo.png"))
+    layout.resolve(rel_path="assets/logo.png")
+    assert len(calls) == 1
+
+    TargetLayout(target_root=tmp_path, policy=_FrozenPolicy("other")).resolve(
+        rel_path=Path("assets/logo.png")
+    )
+    assert calls == [str(tmp_path), "other"]
+
+
+def test_frozen_policy_with_unhashable_field_is_mapped_uncached(
+    tmp_path: Path,
+) -> None:
+    @dataclass(frozen=True)
+    class _TablePolicy:
+        table: dict
+
+        def map_relative_path(self, rel_path: Path) -> Path:
+            return Path(self.table[rel_path.as_posix()])
+
+    policy = _TablePolicy({"assets/logo.png": "media/logo.png"})
+    layout = TargetLayout(target_root=tmp_path, policy=policy)
+
+    assert layout.resolve(rel_path="assets/logo.png") == (
+        tmp_path / "media" / "logo.png"
+    )
+
+
+def test_stateful_policy_mapping_is_not_memoized(tmp_path: Path) -> None:
+    class _CountingPolicy:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def map_relative_path(self, rel_path: Path) -> Path:
+            self.calls += 1
+            return Path("media") / rel_path.name
+
+    policy = _CountingPolicy()
+    layout = TargetLayout(target_root=tmp_path, policy=policy)
+
+    layout.resolve(rel_path=Path("assets/logo.png"))
+    layout.resolve(rel_path=Path("assets/logo.png"))
+    assert policy.calls == 2
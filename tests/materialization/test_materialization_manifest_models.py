@@ -45,6 +45,13 @@ def test_materialized_file_to_dict(tmp_path: Path) -> None:
     assert payload["layout_metadata"]["format"] == "dita"
 
 
+def test_materialized_file_caches_path_string(tmp_path: Path) -> None:
+    mf = MaterializedFile(path=tmp_path / "a.dita")
+
+    assert mf.path_str == str(tmp_path / "a.dita")
+    assert mf == MaterializedFile(path=tmp_path / "a.dita")
+
+
 def test_materialized_file_is_immutable(tmp_path: Path) -> None:
     mf = MaterializedFile(
         path=tmp_path / "a.dita",
@@ -55,11 +62,47 @@ def test_materialized_file_is_immutable(tmp_path: Path) -> None:
         mf.path = tmp_path / "b.dita"
 
 
+def test_materialized_file_layout_metadata_is_read_only(tmp_path: Path) -> None:
+    metadata = {"format": "dita"}
+    mf = MaterializedFile(path=tmp_path / "a.dita", layout_metadata=metadata)
+
+    metadata["format"] = "changed"
+
+    assert mf.layout_metadata["format"] == "dita"
+    with pytest.raises(TypeError):
+        mf.layout_metadata["format"] = "x"  # type: ignore[index]
+
+
+def test_materialized_files_share_empty_metadata(tmp_path: Path) -> None:
+    a = MaterializedFile(path=tmp_path / "a.dita")
+    b = MaterializedFile(path=tmp_path / "b.dita")
+
+    assert a.layout_metadata is b.layout_metadata
+    assert a.to_dict()["layout_metadata"] == {}
+
+
+def test_materialized_file_uses_slots(tmp_path: Path) -> None:
+    mf = MaterializedFile(path=tmp_path / "a.dita")
+
+    assert not hasattr(mf, "__dict__")
+
+
 # ----------------------------------------------------------------------
 # MaterializationManifest
 # ----------------------------------------------------------------------
 
 
+def test_manifest_freezes_files_into_tuple(tmp_path: Path) -> None:
+    target_root = tmp_path / "out"
+    files = [MaterializedFile(path=target_root / "a.dita")]
+
+    manifest = MaterializationManifest(target_root=target_root, files=files)
+    files.append(MaterializedFile(path=target_root / "b.dita"))
+
+    assert isinstance(manifest.files, tuple)
+    assert len(manifest.files) == 1
+
+
 def test_materialization_manifest_to_dict(tmp_path: Path) -> None:
     target_root = tmp_path / "out"
 
@@ -81,6 +124,24 @@ def test_materialization_manifest_to_dict(tmp_path: Path) -> None:
     assert payload["metadata"]["profile"] == "publish"
 
 
+def test_manifest_file_payloads_match_materialized_file_to_dict(
+    tmp_path: Path,
+) -> None:
+    target_root = tmp_path / "out"
+    files = [
+        MaterializedFile(
+            path=target_root / "topics" / "intro.dita",
+            source_action_id="a1",
+            role="topic",
+            layout_metadata={"format": "dita"},
+        ),
+    ]
+
+    manifest = MaterializationManifest(target_root=target_root, files=files)
+
+    assert manifest.to_dict()["files"] == [f.to_dict() for f in files]
+
+
 def test_manifest_rejects_relative_paths(tmp_path: Path) -> None:
     with pytest.raises(ValueError):
         MaterializationManifest(
@@ -128,4 +189,27 @@ def test_manifest_is_deterministic(tmp_path: Path) -> None:
     m1 = MaterializationManifest(target_root=target_root, files=files)
     m2 = MaterializationManifest(target_root=target_root, files=files)
 
-    assert m1.to_dict() == m2.to_dict()
\ No newline at end of file
+    assert m1.to_dict() == m2.to_dict()
+
+
+def test_manifest_rejects_collisions_after_normalization(tmp_path: Path) -> None:
+    target_root = tmp_path / "out"
+
+    with pytest.raises(ValueError):
+        MaterializationManifest(
+            target_root=target_root,
+            files=[
+                MaterializedFile(path=target_root / "topics" / "a.dita"),
+                MaterializedFile(path=target_root / "x" / ".." / "topics" / "a.dita"),
+            ],
+        )
+
+
+def test_manifest_rejects_traversal_out_of_target_root(tmp_path: Path) -> None:
+    target_root = tmp_path / "out"
+
+    with pytest.raises(ValueError):
+        MaterializationManifest(
+            target_root=target_root,
+            files=[MaterializedFile(path=target_root / ".." / "escape.dita")],
+        )
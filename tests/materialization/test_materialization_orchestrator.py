@@ -148,17 +148,19 @@ def test_finalize_calls_manifest_writer(tmp_path: Path) -> None:
     )
 
 
-def test_preflight_emits_lifecycle_logs(caplog, tmp_path: Path) -> None:
+def test_preflight_emits_lifecycle_logs(
+    caplog, tmp_path: Path, null_collaborator
+) -> None:
     """
     Preflight must emit lifecycle observability logs.
     """
     orchestrator = MaterializationOrchestrator(
         plan=_minimal_plan(tmp_path),
         target_root=tmp_path / "target",
-        builder=MagicMock(),
-        validator=MagicMock(),
-        collision_detector=MagicMock(),
-        manifest_writer=MagicMock(),
+        builder=null_collaborator,
+        validator=null_collaborator,
+        collision_detector=null_collaborator,
+        manifest_writer=null_collaborator,
     )
 
     with caplog.at_level("INFO"):
@@ -167,4 +169,67 @@ def test_preflight_emits_lifecycle_logs(caplog, tmp_path: Path) -> None:
     messages = [record.message.lower() for record in caplog.records]
 
     assert any("preflight start" in m for m in messages)
-    assert any("preflight complete" in m for m in messages)
\ No newline at end of file
+    assert any("preflight complete" in m for m in messages)
+
+
+def test_lifecycle_logs_carry_target_root(
+    caplog, tmp_path: Path, null_collaborator
+) -> None:
+    """
+    Lifecycle records expose target_root as a structured attribute.
+    """
+    orchestrator = MaterializationOrchestrator(
+        plan=_minimal_plan(tmp_path),
+        target_root=tmp_path / "target",
+        builder=null_collaborator,
+        validator=null_collaborator,
+        collision_detector=null_collaborator,
+        manifest_writer=null_collaborator,
+    )
+
+    with caplog.at_level("INFO"):
+        orchestrator.preflight()
+
+    lifecycle = [
+        r for r in caplog.records if "PREFLIGHT" in r.getMessage()
+    ]
+
+    assert lifecycle
+    assert all(
+        r.target_root == str(orchestrator.target_root) for r in lifecycle
+    )
+
+
+def test_relative_targets_resolve_through_layout_and_collide(
+    tmp_path: Path,
+    null_collaborator,
+) -> None:
+    """
+    Relative action targets are mapped by the default layout, and two
+    targets that map to the same file are caught by the default detector.
+    """
+    plan = _minimal_plan(tmp_path)
+    plan.actions[:] = [
+        PlanAction(
+            id=action_id,
+            type=ActionType.COPY_TOPIC.value,
+            target=target,
+            reason="test",
+            parameters={},
+            derived_from_evidence=[],
+        )
+        for action_id, target in (("t1", "a/intro.dita"), ("t2", "b/intro.dita"))
+    ]
+
+    orchestrator = MaterializationOrchestrator(
+        plan=plan,
+        target_root=tmp_path / "target",
+        builder=null_collaborator,
+    )
+
+    assert [a.path for a in orchestrator._derived_artifacts] == [
+        (tmp_path / "target" / "topics" / "intro.dita").resolve(),
+    ] * 2
+
+    with pytest.raises(MaterializationOrchestrationError):
+        orchestrator.preflight()
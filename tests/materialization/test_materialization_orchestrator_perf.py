@@ -0,0 +1,93 @@
+"""
+Throughput smoke test for MaterializationOrchestrator construction and
+preflight.
+
+Collaborators are counter-based fakes rather than ``MagicMock`` so the
+timing reflects orchestrator work (artifact derivation and preflight
+sequencing), not mock bookkeeping. The test asserts call counts only;
+the elapsed time is reported through the log for profiling runs.
+
+Marked ``perf``: skipped unless pytest is run with ``--run-perf``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dita_package_processor.materialization.orchestrator import (
+    MaterializationOrchestrator,
+)
+from dita_package_processor.planning.models import ActionType, Plan, PlanAction
+
+LOGGER = logging.getLogger(__name__)
+
+_ACTIONS = 2_000
+_ROUNDS = 50
+
+
+def _large_plan() -> Plan:
+    return Plan(
+        plan_version=1,
+        generated_at=datetime.now(timezone.utc),
+        source_discovery={},
+        intent={},
+        actions=[
+            PlanAction(
+                id=f"t{i}",
+                type=ActionType.COPY_TOPIC.value,
+                target=f"topics/t{i}.dita",
+                reason="perf",
+                parameters={},
+                derived_from_evidence=[],
+            )
+            for i in range(_ACTIONS)
+        ],
+    )
+
+
+@pytest.mark.perf
+def test_preflight_throughput_with_counter_fakes(
+    tmp_path: Path,
+    counting_collaborators: SimpleNamespace,
+) -> None:
+    builder = counting_collaborators.builder
+    validator = counting_collaborators.validator
+    collision_detector = counting_collaborators.collision_detector
+    manifest_writer = counting_collaborators.manifest_writer
+
+    plan = _large_plan()
+    target_root = tmp_path / "target"
+
+    # Artifact derivation happens in __init__, so construction is timed
+    # together with preflight.
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        orchestrator = MaterializationOrchestrator(
+            plan=plan,
+            target_root=target_root,
+            builder=builder,
+            validator=validator,
+            collision_detector=collision_detector,
+            manifest_writer=manifest_writer,
+        )
+        orchestrator.preflight()
+    elapsed = time.perf_counter() - start
+
+    LOGGER.info(
+        "construct+preflight x%d over %d actions: %.4fs",
+        _ROUNDS,
+        _ACTIONS,
+        elapsed,
+    )
+
+    assert len(orchestrator._derived_artifacts) == _ACTIONS
+    assert builder.build.n == _ROUNDS
+    assert validator.validate_preflight.n == _ROUNDS
+    assert collision_detector.detect.n == _ROUNDS
+    assert manifest_writer.write_preflight.n == _ROUNDS
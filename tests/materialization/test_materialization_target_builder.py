@@ -11,6 +11,8 @@ These tests validate that the builder:
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -90,26 +92,31 @@ def test_fails_if_target_is_a_file(tmp_path: Path) -> None:
         builder.build()
 
 
-def test_fails_if_target_is_not_writable(tmp_path: Path) -> None:
+@pytest.mark.skipif(
+    sys.platform == "win32" or os.geteuid() == 0,
+    reason="chmod-based permission check requires non-root POSIX",
+)
+def test_fails_if_target_is_not_writable(
+    tmp_path: Path,
+    request: pytest.FixtureRequest,
+) -> None:
     """
     Builder must fail if the target directory is not writable.
 
-    Note: chmod-based permission tests can be flaky on CI,
-    but are reliable locally.
+    Root ignores directory permission bits and Windows does not honour
+    POSIX modes, so the test is skipped there.
     """
     target = tmp_path / "target"
     target.mkdir()
     target.chmod(0o400)  # read-only
+    request.addfinalizer(lambda: target.chmod(0o700))
 
     builder = TargetMaterializationBuilder(
         manifest=_manifest(target),
     )
 
-    try:
-        with pytest.raises(MaterializationError):
-            builder.build()
-    finally:
-        target.chmod(0o700)
+    with pytest.raises(MaterializationError):
+        builder.build()
 
 
 def test_logs_materialization_steps(caplog, tmp_path: Path) -> None:
@@ -123,7 +130,13 @@ def test_logs_materialization_steps(caplog, tmp_path: Path) -> None:
     with caplog.at_level("INFO"):
         builder.build()
 
-    messages = [r.message.lower() for r in caplog.records]
+    saw_materialization = saw_target = False
+    for record in caplog.records:
+        message = record.message.lower()
+        saw_materialization = saw_materialization or "materialization" in message
+        saw_target = saw_target or "target" in message
+        if saw_materialization and saw_target:
+            break
 
-    assert any("materialization" in m for m in messages)
-    assert any("target" in m for m in messages)
\ No newline at end of file
+    assert saw_materialization
+    assert saw_target
\ No newline at end of file
@@ -14,12 +14,14 @@ Discovery and planning are tested elsewhere.
 No filesystem mutation or execution occurs here.
 """
 
-from __future__ import annotations
-
 from pathlib import Path
 
 import pytest
 
+from dita_package_processor.execution.dry_run_executor import DryRunExecutor
+from dita_package_processor.execution.executors.filesystem import (
+    FilesystemExecutor,
+)
 from dita_package_processor.orchestration import get_executor
 
 
@@ -28,14 +30,30 @@ from dita_package_processor.orchestration import get_executor
 # =============================================================================
 
 
-def test_get_executor_returns_filesystem_executor(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("name", "apply_flag", "expected_cls", "raises"),
+    [
+        ("filesystem", True, FilesystemExecutor, None),
+        ("noop", False, DryRunExecutor, None),
+        ("not-a-real-executor", False, None, ValueError),
+    ],
+    ids=["filesystem", "noop", "unknown"],
+)
+def test_get_executor(
+    tmp_path: Path,
+    name: str,
+    apply_flag: bool,
+    expected_cls: type | None,
+    raises: type[Exception] | None,
+) -> None:
     """
-    "filesystem" must resolve to FilesystemExecutor.
+    Executor names resolve to the expected backend.
 
     Orchestration must:
     - pass constructor arguments explicitly
     - resolve paths before passing
-    - not mutate apply flag
+    - not mutate the apply flag
+    - reject unknown names with ValueError
     """
     source_root = tmp_path / "src"
     sandbox_root = tmp_path / "out"
@@ -43,55 +61,25 @@ def test_get_executor_returns_filesystem_executor(tmp_path: Path) -> None:
     source_root.mkdir()
     sandbox_root.mkdir()
 
+    if raises is not None:
+        with pytest.raises(raises, match="Unknown executor"):
+            get_executor(
+                name,
+                apply=apply_flag,
+                source_root=source_root,
+                sandbox_root=sandbox_root,
+            )
+        return
+
     executor = get_executor(
-        "filesystem",
-        apply=True,
+        name,
+        apply=apply_flag,
         source_root=source_root,
         sandbox_root=sandbox_root,
     )
 
-    from dita_package_processor.execution.executors.filesystem import (
-        FilesystemExecutor,
-    )
-
-    assert isinstance(executor, FilesystemExecutor)
-
-    # We only verify orchestration-level guarantees:
-    # The resolved source_root and apply flag.
-    assert executor.source_root == source_root.resolve()
-    assert executor.apply is True
-
-
-def test_get_executor_returns_dry_run_executor_for_noop(
-    tmp_path: Path,
-) -> None:
-    """
-    "noop" must resolve to DryRunExecutor.
-
-    Orchestration must not inspect or adapt signatures.
-    """
-    executor = get_executor(
-        "noop",
-        apply=False,
-        source_root=tmp_path,
-        sandbox_root=tmp_path,
-    )
-
-    from dita_package_processor.execution.dry_run_executor import (
-        DryRunExecutor,
-    )
-
-    assert isinstance(executor, DryRunExecutor)
-
+    assert isinstance(executor, expected_cls)
 
-def test_get_executor_rejects_unknown_executor(tmp_path: Path) -> None:
-    """
-    Unknown executor names must raise ValueError.
-    """
-    with pytest.raises(ValueError, match="Unknown executor"):
-        get_executor(
-            "not-a-real-executor",
-            apply=False,
-            source_root=tmp_path,
-            sandbox_root=tmp_path,
-        )
\ No newline at end of file
+    if isinstance(executor, FilesystemExecutor):
+        assert executor.source_root == source_root.resolve()
+        assert executor.apply is apply_flag
@@ -11,7 +11,13 @@ copy actions from a dependency-ordered contract input. The planner must:
 - Accept only PlanningInput contract objects
 """
 
-from pathlib import Path
+from functools import lru_cache
+from os.path import normpath
+from operator import itemgetter
+from typing import Any, Dict
+
+import jsonschema
+import pytest
 
 from dita_package_processor.planning.planner import Planner
 from dita_package_processor.planning.contracts import (
@@ -21,17 +27,54 @@ from dita_package_processor.planning.contracts import (
 )
 
 
+#: Keys that belong to execution results and must never appear in a plan.
+_EXECUTION_ONLY_KEYS = frozenset(
+    {
+        "status",
+        "dry_run",
+        "handler",
+        "result",
+        "execution",
+    }
+)
+
+
+_action_id = itemgetter("id")
+
+#: Every action carries non-empty string source and target paths.
+_PATH_PARAMETERS_VALIDATOR = jsonschema.Draft7Validator(
+    {
+        "type": "object",
+        "required": ["parameters"],
+        "properties": {
+            "parameters": {
+                "type": "object",
+                "required": ["source_path", "target_path"],
+                "properties": {
+                    "source_path": {"type": "string", "minLength": 1},
+                    "target_path": {"type": "string", "minLength": 1},
+                },
+            },
+        },
+    }
+)
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def _minimal_planning_input() -> PlanningInput:
     """
     Construct a minimal PlanningInput:
 
         A.ditamap (MAIN)
             └── topics/B.dita
+
+    Cached: the planner never mutates its input, so every caller can
+    share one instance.
     """
 
     artifacts = [
@@ -63,15 +106,33 @@ def _minimal_planning_input() -> PlanningInput:
     )
 
 
+@pytest.fixture(scope="module")
+def planner() -> Planner:
+    """
+    Planner shared by every test in this module.
+
+    Construction loads the plan schema from disk; the planner holds no
+    per-plan state, so one instance serves all tests.
+    """
+    return Planner()
+
+
+@pytest.fixture(scope="module")
+def plan(planner: Planner) -> Dict[str, Any]:
+    """
+    Plan for ``_minimal_planning_input()``, computed once per module.
+
+    Tests only read it; the determinism test re-plans explicitly.
+    """
+    return planner.plan(_minimal_planning_input())
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
-def test_planner_emits_copy_actions() -> None:
-    planner = Planner()
-    plan = planner.plan(_minimal_planning_input())
-
+def test_planner_emits_copy_actions(plan: Dict[str, Any]) -> None:
     actions = plan["actions"]
 
     assert len(actions) == 2
@@ -79,70 +140,36 @@ def test_planner_emits_copy_actions() -> None:
     assert actions[1]["type"] == "copy_topic"
 
 
-def test_planner_emits_parameters_with_paths() -> None:
-    planner = Planner()
-    plan = planner.plan(_minimal_planning_input())
-
+def test_planner_emits_parameters_with_paths(plan: Dict[str, Any]) -> None:
     for action in plan["actions"]:
-        assert "parameters" in action
-        params = action["parameters"]
-
-        assert "source_path" in params
-        assert "target_path" in params
+        _PATH_PARAMETERS_VALIDATOR.validate(action)
 
-        assert isinstance(params["source_path"], str)
-        assert isinstance(params["target_path"], str)
-
-        assert params["source_path"]
-        assert params["target_path"]
-
-
-def test_planner_uses_layout_rules_for_target_paths() -> None:
-    planner = Planner()
-    plan = planner.plan(_minimal_planning_input())
 
+def test_planner_uses_layout_rules_for_target_paths(plan: Dict[str, Any]) -> None:
     for action in plan["actions"]:
         params = action["parameters"]
-        src = Path(params["source_path"])
-        tgt = Path(params["target_path"])
 
-        assert src != tgt
+        assert normpath(params["source_path"]) != normpath(params["target_path"])
 
 
-def test_planner_emits_deterministic_action_ids() -> None:
-    planner = Planner()
-
+def test_planner_emits_deterministic_action_ids(planner: Planner) -> None:
     plan1 = planner.plan(_minimal_planning_input())
     plan2 = planner.plan(_minimal_planning_input())
 
-    ids1 = [a["id"] for a in plan1["actions"]]
-    ids2 = [a["id"] for a in plan2["actions"]]
-
-    assert ids1 == ids2
-
+    assert tuple(map(_action_id, plan1["actions"])) == tuple(
+        map(_action_id, plan2["actions"])
+    )
 
-def test_planner_includes_reason_field() -> None:
-    planner = Planner()
-    plan = planner.plan(_minimal_planning_input())
 
+def test_planner_includes_reason_field(plan: Dict[str, Any]) -> None:
     for action in plan["actions"]:
         assert "reason" in action
         assert isinstance(action["reason"], str)
         assert action["reason"].strip()
 
 
-def test_planner_outputs_dispatchable_actions_only() -> None:
-    planner = Planner()
-    plan = planner.plan(_minimal_planning_input())
-
-    forbidden = {
-        "status",
-        "dry_run",
-        "handler",
-        "result",
-        "execution",
-    }
-
+def test_planner_outputs_dispatchable_actions_only(plan: Dict[str, Any]) -> None:
     for action in plan["actions"]:
-        for key in forbidden:
-            assert key not in action
\ No newline at end of file
+        assert _EXECUTION_ONLY_KEYS.isdisjoint(action), (
+            _EXECUTION_ONLY_KEYS & action.keys()
+        )
@@ -20,6 +20,8 @@ There are two enforcement layers:
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from dita_package_processor.planning.contracts.discovery_to_planning import (
@@ -30,12 +32,39 @@ from dita_package_processor.planning.contracts.errors import (
 )
 from dita_package_processor.planning.planner import Planner
 
+# Minimal valid discovery payload. Negative tests derive variants with
+# shallow ``{**base, key: value}`` overrides; normalization never mutates
+# its input, so the shared nested objects are safe.
+_BASE_ARTIFACT_MAIN = {
+    "path": "index.ditamap",
+    "artifact_type": "map",
+    "classification": "MAIN",
+}
+_BASE_DISCOVERY = {
+    "artifacts": [_BASE_ARTIFACT_MAIN],
+    "relationships": [],
+    "summary": {},
+}
+
+# Messages asserted by more than one test.
+_RE_NO_MAIN = re.compile(r"Exactly one artifact must be classified as MAIN map")
+_RE_REQUIRES_PLANNING_INPUT = re.compile(
+    r"Planner\.plan\(\) requires PlanningInput"
+)
+
 
 # =============================================================================
 # Discovery → Planning contract failures
 # =============================================================================
 
 
+def test_base_discovery_is_valid() -> None:
+    """The shared base must normalize, so each variant fails on its override."""
+    planning_input = normalize_discovery_report(_BASE_DISCOVERY)
+
+    assert planning_input.main_map == "index.ditamap"
+
+
 def test_discovery_contract_rejects_non_object() -> None:
     """Normalization must reject non-dict discovery payloads."""
     with pytest.raises(
@@ -47,11 +76,7 @@ def test_discovery_contract_rejects_non_object() -> None:
 
 def test_discovery_contract_rejects_artifact_not_object() -> None:
     """Artifacts must be objects; lists of strings must fail."""
-    discovery = {
-        "artifacts": ["not-an-object"],
-        "relationships": [],
-        "summary": {},
-    }
+    discovery = {**_BASE_DISCOVERY, "artifacts": ["not-an-object"]}
 
     with pytest.raises(
         PlanningContractError,
@@ -62,17 +87,7 @@ def test_discovery_contract_rejects_artifact_not_object() -> None:
 
 def test_discovery_contract_rejects_relationship_not_object() -> None:
     """Relationships must be objects; lists of strings must fail."""
-    discovery = {
-        "artifacts": [
-            {
-                "path": "index.ditamap",
-                "artifact_type": "map",
-                "classification": "MAIN",
-            }
-        ],
-        "relationships": ["not-an-object"],
-        "summary": {},
-    }
+    discovery = {**_BASE_DISCOVERY, "relationships": ["not-an-object"]}
 
     with pytest.raises(
         PlanningContractError,
@@ -84,15 +99,8 @@ def test_discovery_contract_rejects_relationship_not_object() -> None:
 def test_discovery_contract_rejects_empty_path() -> None:
     """Empty artifact paths must fail contract validation."""
     discovery = {
-        "artifacts": [
-            {
-                "path": "",
-                "artifact_type": "map",
-                "classification": "MAIN",
-            }
-        ],
-        "relationships": [],
-        "summary": {},
+        **_BASE_DISCOVERY,
+        "artifacts": [{**_BASE_ARTIFACT_MAIN, "path": ""}],
     }
 
     with pytest.raises(
@@ -105,15 +113,8 @@ def test_discovery_contract_rejects_empty_path() -> None:
 def test_discovery_contract_rejects_invalid_artifact_type() -> None:
     """Invalid artifact types must fail normalization."""
     discovery = {
-        "artifacts": [
-            {
-                "path": "index.ditamap",
-                "artifact_type": "banana",
-                "classification": "MAIN",
-            }
-        ],
-        "relationships": [],
-        "summary": {},
+        **_BASE_DISCOVERY,
+        "artifacts": [{**_BASE_ARTIFACT_MAIN, "artifact_type": "banana"}],
     }
 
     with pytest.raises(
@@ -128,20 +129,13 @@ def test_discovery_contract_rejects_non_string_classification() -> None:
     Non-string classification values must fail MAIN selection.
     """
     discovery = {
-        "artifacts": [
-            {
-                "path": "index.ditamap",
-                "artifact_type": "map",
-                "classification": 123,
-            }
-        ],
-        "relationships": [],
-        "summary": {},
+        **_BASE_DISCOVERY,
+        "artifacts": [{**_BASE_ARTIFACT_MAIN, "classification": 123}],
     }
 
     with pytest.raises(
         PlanningContractError,
-        match=r"Exactly one artifact must be classified as MAIN map",
+        match=_RE_NO_MAIN,
     ):
         normalize_discovery_report(discovery)
 
@@ -151,20 +145,13 @@ def test_discovery_contract_rejects_missing_main_map() -> None:
     Exactly one MAIN map must exist.
     """
     discovery = {
-        "artifacts": [
-            {
-                "path": "index.ditamap",
-                "artifact_type": "map",
-                "classification": None,
-            }
-        ],
-        "relationships": [],
-        "summary": {},
+        **_BASE_DISCOVERY,
+        "artifacts": [{**_BASE_ARTIFACT_MAIN, "classification": None}],
     }
 
     with pytest.raises(
         PlanningContractError,
-        match=r"Exactly one artifact must be classified as MAIN map",
+        match=_RE_NO_MAIN,
     ):
         normalize_discovery_report(discovery)
 
@@ -184,7 +171,7 @@ def test_planner_rejects_raw_dict_input() -> None:
 
     with pytest.raises(
         TypeError,
-        match=r"Planner\.plan\(\) requires PlanningInput",
+        match=_RE_REQUIRES_PLANNING_INPUT,
     ):
         planner.plan({"artifacts": []})  # type: ignore[arg-type]
 
@@ -195,7 +182,7 @@ def test_planner_rejects_none() -> None:
 
     with pytest.raises(
         TypeError,
-        match=r"Planner\.plan\(\) requires PlanningInput",
+        match=_RE_REQUIRES_PLANNING_INPUT,
     ):
         planner.plan(None)  # type: ignore[arg-type]
 
@@ -215,7 +202,7 @@ def test_planner_rejects_discovery_like_shape() -> None:
 
     with pytest.raises(
         TypeError,
-        match=r"Planner\.plan\(\) requires PlanningInput",
+        match=_RE_REQUIRES_PLANNING_INPUT,
     ):
         planner.plan(discovery_like)  # type: ignore[arg-type]
 
@@ -237,6 +224,6 @@ def test_planner_requires_planninginput_instance() -> None:
 
     with pytest.raises(
         TypeError,
-        match=r"Planner\.plan\(\) requires PlanningInput",
+        match=_RE_REQUIRES_PLANNING_INPUT,
     ):
         planner.plan(structurally_valid_dict)  # type: ignore[arg-type]
\ No newline at end of file
@@ -22,6 +22,52 @@ from dita_package_processor.planning.contracts import (
 )
 
 
+# =============================================================================
+# Expected wire format
+# =============================================================================
+
+
+#: Canonical ``PlanningInput.to_dict()`` output for the two-artifact input
+#: built in ``test_planning_input_to_dict``.
+_EXPECTED_PLAN_DICT = {
+    "contract_version": "planning.input.v1",
+    "main_map": "maps/index.ditamap",
+    "artifacts": [
+        {
+            "path": "maps/index.ditamap",
+            "artifact_type": "map",
+            "classification": "MAIN",
+            "metadata": {},
+        },
+        {
+            "path": "topics/a.dita",
+            "artifact_type": "topic",
+            "classification": None,
+            "metadata": {},
+        },
+    ],
+    "relationships": [
+        {
+            "source": "maps/index.ditamap",
+            "target": "topics/a.dita",
+            "type": "topicref",
+            "pattern_id": "dita_map_topicref",
+        }
+    ],
+}
+
+#: Locked public contract surface.
+_EXPECTED_INPUT_KEYS = frozenset(
+    {"contract_version", "main_map", "artifacts", "relationships"}
+)
+_EXPECTED_ARTIFACT_KEYS = frozenset(
+    {"path", "artifact_type", "classification", "metadata"}
+)
+_EXPECTED_RELATIONSHIP_KEYS = frozenset(
+    {"source", "target", "type", "pattern_id"}
+)
+
+
 # =============================================================================
 # PlanningArtifact
 # =============================================================================
@@ -141,32 +187,7 @@ def test_planning_input_to_dict() -> None:
 
     data = planning_input.to_dict()
 
-    assert data == {
-        "contract_version": "planning.input.v1",
-        "main_map": "maps/index.ditamap",
-        "artifacts": [
-            {
-                "path": "maps/index.ditamap",
-                "artifact_type": "map",
-                "classification": "MAIN",
-                "metadata": {},
-            },
-            {
-                "path": "topics/a.dita",
-                "artifact_type": "topic",
-                "classification": None,
-                "metadata": {},
-            },
-        ],
-        "relationships": [
-            {
-                "source": "maps/index.ditamap",
-                "target": "topics/a.dita",
-                "type": "topicref",
-                "pattern_id": "dita_map_topicref",
-            }
-        ],
-    }
+    assert data == _EXPECTED_PLAN_DICT
 
 
 def test_planning_input_does_not_mutate_inputs() -> None:
@@ -239,23 +260,6 @@ def test_contract_surface_is_minimal_and_explicit() -> None:
 
     data = planning_input.to_dict()
 
-    assert set(data.keys()) == {
-        "contract_version",
-        "main_map",
-        "artifacts",
-        "relationships",
-    }
-
-    assert set(data["artifacts"][0].keys()) == {
-        "path",
-        "artifact_type",
-        "classification",
-        "metadata",
-    }
-
-    assert set(data["relationships"][0].keys()) == {
-        "source",
-        "target",
-        "type",
-        "pattern_id",
-    }
\ No newline at end of file
+    assert data.keys() == _EXPECTED_INPUT_KEYS
+    assert data["artifacts"][0].keys() == _EXPECTED_ARTIFACT_KEYS
+    assert data["relationships"][0].keys() == _EXPECTED_RELATIONSHIP_KEYS
\ No newline at end of file
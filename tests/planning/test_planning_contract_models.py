@@ -32,4 +32,66 @@ def test_planning_input_to_dict_keys() -> None:
         relationships=[],
     )
     data = inp.to_dict()
-    assert set(data.keys()) == {"contract_version", "main_map", "artifacts", "relationships"}
\ No newline at end of file
+    assert set(data.keys()) == {"contract_version", "main_map", "artifacts", "relationships"}
+
+
+def test_planning_contract_models_use_slots() -> None:
+    artifact = PlanningArtifact(path="index.ditamap", artifact_type="map")
+    rel = PlanningRelationship(
+        source="a",
+        target="b",
+        rel_type="topicref",
+        pattern_id="p",
+    )
+    inp = PlanningInput(
+        contract_version="planning.input.v1",
+        main_map="index.ditamap",
+        artifacts=[artifact],
+        relationships=[rel],
+    )
+
+    for obj in (artifact, rel, inp):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_planning_input_freezes_collections_into_tuples() -> None:
+    artifacts = [PlanningArtifact(path="index.ditamap", artifact_type="map")]
+    relationships = [
+        PlanningRelationship(
+            source="index.ditamap",
+            target="index.ditamap",
+            rel_type="topicref",
+            pattern_id="p",
+        )
+    ]
+
+    inp = PlanningInput(
+        contract_version="planning.input.v1",
+        main_map="index.ditamap",
+        artifacts=artifacts,
+        relationships=relationships,
+    )
+    artifacts.append(PlanningArtifact(path="a.dita", artifact_type="topic"))
+
+    assert isinstance(inp.artifacts, tuple)
+    assert isinstance(inp.relationships, tuple)
+    assert len(inp.artifacts) == 1
+    assert isinstance(inp.to_dict()["artifacts"], list)
+
+
+def test_planning_input_indexes_artifacts_by_path() -> None:
+    main = PlanningArtifact(path="index.ditamap", artifact_type="map")
+    topic = PlanningArtifact(path="a.dita", artifact_type="topic")
+    shadow = PlanningArtifact(path="a.dita", artifact_type="media")
+
+    inp = PlanningInput(
+        contract_version="planning.input.v1",
+        main_map="index.ditamap",
+        artifacts=[main, topic, shadow],
+        relationships=[],
+    )
+
+    assert inp.artifact_by_path("a.dita") is topic
+    assert inp.artifact_by_path("missing.dita") is None
+    assert set(inp.artifact_paths) == {"index.ditamap", "a.dita"}
+    assert "_by_path" not in repr(inp)
@@ -15,13 +15,20 @@ All other classifications are deterministically collapsed to None.
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
+from dita_package_processor.planning.contracts import discovery_to_planning
 from dita_package_processor.planning.contracts.discovery_to_planning import (
     normalize_discovery_report,
 )
 from dita_package_processor.planning.contracts.errors import PlanningContractError
 
+# Messages asserted by more than one test.
+_RE_MUST_BE_LIST = re.compile(r"must be a list")
+_RE_NO_MAIN = re.compile(r"Exactly one artifact must be classified as MAIN map")
+
 
 # =============================================================================
 # Fixtures
@@ -113,9 +120,42 @@ def test_non_main_classification_collapses_to_none() -> None:
 
     planning = normalize_discovery_report(discovery)
 
-    classes = {a.path: a.classification for a in planning.artifacts}
+    glossary = next(
+        a for a in planning.artifacts if a.path == "topics/glossary.dita"
+    )
+
+    assert glossary.classification is None
+
+
+def test_relationship_endpoints_share_artifact_path_strings() -> None:
+    discovery = _minimal_discovery()
+    rel_raw = discovery["relationships"][0]
+    # Build endpoints at runtime so they are distinct objects from the
+    # artifact path literals; only interning can make them identical.
+    rel_raw["source"] = "".join(["index", ".ditamap"])
+    rel_raw["target"] = "".join(["topics/", "a.dita"])
+    assert rel_raw["source"] is not discovery["artifacts"][0]["path"]
+
+    planning = normalize_discovery_report(discovery)
+    paths = {a.path: a.path for a in planning.artifacts}
+    rel = planning.relationships[0]
+
+    assert rel.source is paths["index.ditamap"]
+    assert rel.target is paths["topics/a.dita"]
+
+
+# =============================================================================
+# Schema validator
+# =============================================================================
+
 
-    assert classes["topics/glossary.dita"] is None
+def test_schema_validator_is_built_once() -> None:
+    validator = discovery_to_planning._schema_validator()
+
+    assert discovery_to_planning._schema_validator() is validator
+    assert validator.is_valid(
+        normalize_discovery_report(_minimal_discovery()).to_dict()
+    )
 
 
 # =============================================================================
@@ -129,14 +169,14 @@ def test_fails_without_required_top_level_keys() -> None:
 
 
 def test_fails_on_non_list_artifacts() -> None:
-    with pytest.raises(PlanningContractError, match="must be a list"):
+    with pytest.raises(PlanningContractError, match=_RE_MUST_BE_LIST):
         normalize_discovery_report(
             {"artifacts": {}, "relationships": [], "summary": {}}
         )
 
 
 def test_fails_on_non_list_relationships() -> None:
-    with pytest.raises(PlanningContractError, match="must be a list"):
+    with pytest.raises(PlanningContractError, match=_RE_MUST_BE_LIST):
         normalize_discovery_report(
             {"artifacts": [], "relationships": {}, "summary": {}}
         )
@@ -148,7 +188,7 @@ def test_fails_when_no_main_map_present() -> None:
 
     with pytest.raises(
         PlanningContractError,
-        match="Exactly one artifact must be classified as MAIN map",
+        match=_RE_NO_MAIN,
     ):
         normalize_discovery_report(bad)
 
@@ -166,7 +206,7 @@ def test_fails_when_multiple_main_maps_present() -> None:
 
     with pytest.raises(
         PlanningContractError,
-        match="Exactly one artifact must be classified as MAIN map",
+        match=_RE_NO_MAIN,
     ):
         normalize_discovery_report(bad)
 
@@ -187,4 +227,13 @@ def test_fails_missing_pattern_id() -> None:
     bad["relationships"][0].pop("pattern_id")
 
     with pytest.raises(PlanningContractError):
-        normalize_discovery_report(bad)
\ No newline at end of file
+        normalize_discovery_report(bad)
+
+
+def test_unhashable_classification_collapses_to_none() -> None:
+    discovery = _minimal_discovery()
+    discovery["artifacts"][1]["classification"] = ["MAIN"]
+
+    planning = normalize_discovery_report(discovery)
+
+    assert planning.artifacts[1].classification is None
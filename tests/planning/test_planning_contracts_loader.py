@@ -10,7 +10,7 @@ Responsibilities tested
 - Fails loudly on:
     - missing file
     - invalid JSON
-    - malformed contract structure
+    - malformed contract structure (checked on in-memory payloads)
 
 No planner logic is exercised here.
 This suite tests only transport + hydration.
@@ -20,11 +20,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 
+from dita_package_processor.planning.contracts import loader
 from dita_package_processor.planning.contracts.loader import (
     PlanningInputLoadError,
+    hydrate_planning_input,
     load_planning_input,
 )
 from dita_package_processor.planning.contracts.planning_input import PlanningInput
@@ -36,8 +39,8 @@ from dita_package_processor.planning.contracts.planning_input import PlanningInp
 
 
 def _write(path: Path, payload: dict) -> Path:
-    """Write JSON payload to path."""
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    """Write JSON payload to path as UTF-8 bytes."""
+    path.write_bytes(json.dumps(payload).encode("utf-8"))
     return path
 
 
@@ -71,16 +74,26 @@ def _valid_contract() -> dict:
     }
 
 
+@pytest.fixture(scope="module")
+def valid_contract_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Write the valid contract once per module.
+
+    Loading never modifies the file, so every happy-path test reads the
+    same copy.
+    """
+    root = tmp_path_factory.mktemp("planning_input")
+    return _write(root / "planning_input.json", _valid_contract())
+
+
 # =============================================================================
 # Happy path
 # =============================================================================
 
 
-def test_load_valid_planning_input(tmp_path: Path) -> None:
+def test_load_valid_planning_input(valid_contract_path: Path) -> None:
     """Valid contract hydrates to PlanningInput instance."""
-    path = _write(tmp_path / "planning_input.json", _valid_contract())
-
-    model = load_planning_input(path)
+    model = load_planning_input(valid_contract_path)
 
     assert isinstance(model, PlanningInput)
     assert model.main_map == "index.ditamap"
@@ -88,6 +101,18 @@ def test_load_valid_planning_input(tmp_path: Path) -> None:
     assert len(model.relationships) == 1
 
 
+def test_load_without_orjson_uses_stdlib_json(
+    valid_contract_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(loader, "_orjson", None)
+
+    model = load_planning_input(valid_contract_path)
+
+    assert model.main_map == "index.ditamap"
+    assert len(model.artifacts) == 2
+
+
 # =============================================================================
 # Filesystem failures
 # =============================================================================
@@ -97,73 +122,73 @@ def test_missing_file_fails(tmp_path: Path) -> None:
     """Missing file must raise PlanningInputLoadError."""
     missing = tmp_path / "nope.json"
 
-    with pytest.raises(PlanningInputLoadError):
+    with pytest.raises(PlanningInputLoadError, match="Failed to read"):
         load_planning_input(missing)
 
 
 def test_invalid_json_fails(tmp_path: Path) -> None:
     """Malformed JSON must raise PlanningInputLoadError."""
     path = tmp_path / "planning_input.json"
-    path.write_text("{ broken json", encoding="utf-8")
+    path.write_bytes(b"{ broken json")
 
-    with pytest.raises(PlanningInputLoadError):
+    with pytest.raises(PlanningInputLoadError, match="Invalid planning_input"):
         load_planning_input(path)
 
 
-# =============================================================================
-# Contract violations
-# =============================================================================
-
-
-def test_missing_required_keys_fail(tmp_path: Path) -> None:
-    """Missing contract fields must fail hydration."""
-    bad = {"artifacts": []}
-
-    path = _write(tmp_path / "planning_input.json", bad)
+def test_non_utf8_bytes_fail(tmp_path: Path) -> None:
+    """Undecodable bytes are a parse failure, not a crash."""
+    path = tmp_path / "planning_input.json"
+    path.write_bytes(b'{"main_map": "\xff"}')
 
-    with pytest.raises(PlanningInputLoadError):
+    with pytest.raises(PlanningInputLoadError, match="Invalid planning_input"):
         load_planning_input(path)
 
 
-def test_artifacts_wrong_type_fail(tmp_path: Path) -> None:
-    """Artifacts must be list."""
-    bad = _valid_contract()
-    bad["artifacts"] = {}
-
-    path = _write(tmp_path / "planning_input.json", bad)
-
-    with pytest.raises(PlanningInputLoadError):
-        load_planning_input(path)
-
+# =============================================================================
+# Contract violations
+# =============================================================================
 
-def test_relationships_wrong_type_fail(tmp_path: Path) -> None:
-    """Relationships must be list."""
-    bad = _valid_contract()
-    bad["relationships"] = {}
 
-    path = _write(tmp_path / "planning_input.json", bad)
+def _without_required_keys(contract: dict) -> dict:
+    return {"artifacts": []}
 
-    with pytest.raises(PlanningInputLoadError):
-        load_planning_input(path)
 
+def _with(key: str, value: Any) -> Callable[[dict], dict]:
+    """Return a mutator replacing one top-level contract field."""
+    return lambda contract: {**contract, key: value}
 
-def test_missing_relationship_fields_fail(tmp_path: Path) -> None:
-    """Malformed relationship record must fail."""
-    bad = _valid_contract()
-    bad["relationships"] = [{"source": "a"}]
 
-    path = _write(tmp_path / "planning_input.json", bad)
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        _without_required_keys,
+        _with("artifacts", {}),
+        _with("relationships", {}),
+        _with("relationships", [{"source": "a"}]),
+        _with("artifacts", [{"path": "a.dita"}]),
+    ],
+    ids=[
+        "missing_required_keys",
+        "artifacts_wrong_type",
+        "relationships_wrong_type",
+        "missing_relationship_fields",
+        "missing_artifact_fields",
+    ],
+)
+def test_malformed_contract_fails(mutate: Callable[[dict], dict]) -> None:
+    """
+    Any malformed contract structure must fail hydration.
 
+    Validation works on the parsed payload, so these cases skip the disk
+    round-trip; reading and parsing are covered above.
+    """
     with pytest.raises(PlanningInputLoadError):
-        load_planning_input(path)
+        hydrate_planning_input(mutate(_valid_contract()))
 
 
-def test_missing_artifact_fields_fail(tmp_path: Path) -> None:
-    """Malformed artifact record must fail."""
-    bad = _valid_contract()
-    bad["artifacts"] = [{"path": "a.dita"}]
+def test_load_and_hydrate_agree(valid_contract_path: Path) -> None:
+    """The file loader and the in-memory entry point build equal models."""
+    loaded = load_planning_input(valid_contract_path)
+    hydrated = hydrate_planning_input(_valid_contract())
 
-    path = _write(tmp_path / "planning_input.json", bad)
-
-    with pytest.raises(PlanningInputLoadError):
-        load_planning_input(path)
\ No newline at end of file
+    assert hydrated.to_dict() == loaded.to_dict()
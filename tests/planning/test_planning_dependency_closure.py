@@ -15,7 +15,11 @@ Tests operate strictly through the public graph construction API
 
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+import pytest
 
 from dita_package_processor.discovery.graph import DependencyGraph
 from dita_package_processor.planning.graph_planner import GraphPlanner
@@ -26,7 +30,21 @@ from dita_package_processor.planning.graph_planner import GraphPlanner
 # =============================================================================
 
 
-def make_graph(edges: Iterable[Tuple[str, str]]) -> DependencyGraph:
+@dataclass(frozen=True)
+class GraphFixture:
+    """
+    A constructed graph together with the serialized form it was built from.
+
+    Keeping the serialized nodes and edges lets :func:`make_planner` feed the
+    planner directly instead of re-serializing ``graph.edges``.
+    """
+
+    graph: DependencyGraph
+    nodes: List[str]
+    relationships: List[Dict[str, str]]
+
+
+def make_graph(edges: Iterable[Tuple[str, str]]) -> GraphFixture:
     """
     Construct a :class:`DependencyGraph` using the serialized schema format.
 
@@ -37,60 +55,87 @@ def make_graph(edges: Iterable[Tuple[str, str]]) -> DependencyGraph:
 
     Returns
     -------
-    DependencyGraph
-        Fully constructed graph instance.
+    GraphFixture
+        Fully constructed graph instance plus its serialized input.
     """
-    return DependencyGraph.from_dict(
+    # Intern once so node and edge endpoints share the same string objects.
+    interned = [(sys.intern(src), sys.intern(tgt)) for src, tgt in edges]
+
+    nodes = sorted({node for edge in interned for node in edge})
+    relationships = [
         {
-            "nodes": sorted({node for edge in edges for node in edge}),
-            "edges": [
-                {
-                    "source": src,
-                    "target": tgt,
-                    "type": "contains",
-                    "pattern_id": "test",
-                }
-                for src, tgt in edges
-            ],
+            "source": src,
+            "target": tgt,
+            "type": "contains",
+            "pattern_id": "test",
         }
-    )
+        for src, tgt in interned
+    ]
 
+    graph = DependencyGraph.from_dict({"nodes": nodes, "edges": relationships})
+    return GraphFixture(graph=graph, nodes=nodes, relationships=relationships)
 
-def make_planner(graph: DependencyGraph) -> GraphPlanner:
+
+def make_planner(fixture: GraphFixture) -> GraphPlanner:
     """
     Construct :class:`GraphPlanner` using serialized relationship dictionaries.
 
     The planner layer must not depend on discovery model classes.
     """
     return GraphPlanner(
-        nodes=graph.nodes,
-        relationships=[edge.to_dict() for edge in graph.edges],
+        nodes=fixture.nodes,
+        relationships=fixture.relationships,
     )
 
 
+# =============================================================================
+# Graphs (built once per module; GraphPlanner never mutates them)
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def chain_graph() -> GraphFixture:
+    return make_graph([("A", "B"), ("B", "C")])
+
+
+@pytest.fixture(scope="module")
+def branching_graph() -> GraphFixture:
+    return make_graph([("A", "B"), ("A", "C"), ("B", "D"), ("C", "E")])
+
+
+@pytest.fixture(scope="module")
+def diamond_graph() -> GraphFixture:
+    return make_graph([("A", "B"), ("A", "C"), ("B", "C")])
+
+
+@pytest.fixture(scope="module")
+def disconnected_graph() -> GraphFixture:
+    return make_graph([("A", "B"), ("X", "Y")])
+
+
+@pytest.fixture(scope="module")
+def unsorted_graph() -> GraphFixture:
+    return make_graph([("Root", "b"), ("Root", "a"), ("a", "c"), ("b", "d")])
+
+
 # =============================================================================
 # Tests
 # =============================================================================
 
 
-def test_dependency_closure_simple_chain() -> None:
+def test_dependency_closure_simple_chain(chain_graph: GraphFixture) -> None:
     """
     A → B → C must include all three nodes in order.
     """
-    graph = make_graph(
-        [
-            ("A", "B"),
-            ("B", "C"),
-        ]
-    )
-
-    planner = make_planner(graph)
+    planner = make_planner(chain_graph)
     result = planner.plan()
 
     assert result == ["A", "B", "C"]
 
 
-def test_dependency_closure_branching_graph() -> None:
+def test_dependency_closure_branching_graph(
+    branching_graph: GraphFixture,
+) -> None:
     """
     Branching graph must produce deterministic depth-first traversal.
 
@@ -105,22 +150,15 @@ def test_dependency_closure_branching_graph() -> None:
 
         A → B → D → C → E
     """
-    graph = make_graph(
-        [
-            ("A", "B"),
-            ("A", "C"),
-            ("B", "D"),
-            ("C", "E"),
-        ]
-    )
-
-    planner = make_planner(graph)
+    planner = make_planner(branching_graph)
     result = planner.plan()
 
     assert result == ["A", "B", "D", "C", "E"]
 
 
-def test_dependency_closure_deduplicates_nodes() -> None:
+def test_dependency_closure_deduplicates_nodes(
+    diamond_graph: GraphFixture,
+) -> None:
     """
     Multiple paths to the same node must not produce duplicates.
 
@@ -130,22 +168,16 @@ def test_dependency_closure_deduplicates_nodes() -> None:
         A → C
         B → C
     """
-    graph = make_graph(
-        [
-            ("A", "B"),
-            ("A", "C"),
-            ("B", "C"),
-        ]
-    )
-
-    planner = make_planner(graph)
+    planner = make_planner(diamond_graph)
     result = planner.plan()
 
     assert result == ["A", "B", "C"]
     assert len(result) == len(set(result))
 
 
-def test_dependency_closure_excludes_unreachable_nodes() -> None:
+def test_dependency_closure_excludes_unreachable_nodes(
+    disconnected_graph: GraphFixture,
+) -> None:
     """
     Nodes not reachable from the root must be excluded.
 
@@ -154,14 +186,7 @@ def test_dependency_closure_excludes_unreachable_nodes() -> None:
         A → B
         X → Y   (disconnected)
     """
-    graph = make_graph(
-        [
-            ("A", "B"),
-            ("X", "Y"),
-        ]
-    )
-
-    planner = make_planner(graph)
+    planner = make_planner(disconnected_graph)
     result = planner.plan()
 
     assert result == ["A", "B"]
@@ -169,22 +194,29 @@ def test_dependency_closure_excludes_unreachable_nodes() -> None:
     assert "Y" not in result
 
 
-def test_dependency_closure_order_is_stable() -> None:
+def test_dependency_closure_order_is_stable(
+    unsorted_graph: GraphFixture,
+) -> None:
     """
     Traversal order must be stable across multiple invocations.
     """
-    graph = make_graph(
-        [
-            ("Root", "b"),
-            ("Root", "a"),
-            ("a", "c"),
-            ("b", "d"),
-        ]
-    )
-
-    planner = make_planner(graph)
+    planner = make_planner(unsorted_graph)
 
     first = planner.plan()
     second = planner.plan()
 
-    assert first == second
\ No newline at end of file
+    assert first == second
+
+
+def test_dependency_closure_plan_is_memoized(
+    chain_graph: GraphFixture,
+) -> None:
+    """
+    Repeated planning reuses the first traversal but never shares the list.
+    """
+    planner = make_planner(chain_graph)
+
+    first = planner.plan()
+    first.append("mutated")
+
+    assert planner.plan() == ["A", "B", "C"]
@@ -16,7 +16,8 @@ Execution rules
 from __future__ import annotations
 
 import logging
-from typing import Type
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping
 
 import pytest
 
@@ -29,14 +30,32 @@ from dita_package_processor.execution.models import ExecutionActionResult
 # =============================================================================
 
 
-@pytest.fixture(params=[DryRunExecutor])
-def executor_cls(request: pytest.FixtureRequest) -> Type[DryRunExecutor]:
+@pytest.fixture(scope="session", params=[DryRunExecutor])
+def executor(request: pytest.FixtureRequest) -> DryRunExecutor:
     """
-    Yield executor classes that must satisfy the shared execution contract.
+    Yield one instance of each executor that must satisfy the shared
+    execution contract.
 
-    Any new executor implementation must be added here.
+    Executors are stateless, so a single instance is shared across the
+    session. Any new executor implementation must be added here; a
+    stateful one needs a function-scoped fixture of its own.
     """
-    return request.param
+    return request.param()
+
+
+@pytest.fixture(autouse=True)
+def _silence_logging() -> Iterator[None]:
+    """
+    Suppress log records for this module.
+
+    Observability is asserted through results only, so records are never
+    needed; disabling logging avoids creating them at all.
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
 
 
 # =============================================================================
@@ -44,20 +63,28 @@ def executor_cls(request: pytest.FixtureRequest) -> Type[DryRunExecutor]:
 # =============================================================================
 
 
+_CANON_ACTION: Mapping[str, str] = MappingProxyType(
+    {
+        "id": "action-001",
+        "type": "noop",
+        "target": "index.ditamap",
+        "reason": "Dry run only",
+    }
+)
+
+
 @pytest.fixture
-def sample_action() -> dict:
+def sample_action() -> Dict[str, str]:
     """
     Minimal valid action structure.
 
     The executor contract does not validate planning semantics —
     it only executes what it is given.
+
+    Each test gets a fresh plain dict (the executor's input contract);
+    the read-only ``_CANON_ACTION`` is the reference it is compared to.
     """
-    return {
-        "id": "action-001",
-        "type": "noop",
-        "target": "index.ditamap",
-        "reason": "Dry run only",
-    }
+    return dict(_CANON_ACTION)
 
 
 # =============================================================================
@@ -66,56 +93,50 @@ def sample_action() -> dict:
 
 
 def test_executor_returns_execution_action_result(
-    executor_cls: Type[DryRunExecutor],
-    sample_action: dict,
+    executor: DryRunExecutor,
+    sample_action: Dict[str, str],
 ) -> None:
     """
     Executor must return an ExecutionActionResult without raising.
     """
-    executor = executor_cls()
     result = executor.execute(sample_action)
 
     assert isinstance(result, ExecutionActionResult)
 
 
 def test_executor_preserves_action_id(
-    executor_cls: Type[DryRunExecutor],
-    sample_action: dict,
+    executor: DryRunExecutor,
+    sample_action: Dict[str, str],
 ) -> None:
     """
     Result must reference the original action ID.
     """
-    executor = executor_cls()
     result = executor.execute(sample_action)
 
     assert result.action_id == sample_action["id"]
 
 
 def test_executor_does_not_mutate_action(
-    executor_cls: Type[DryRunExecutor],
-    sample_action: dict,
+    executor: DryRunExecutor,
+    sample_action: Dict[str, str],
 ) -> None:
     """
     Executors must not mutate the input action dictionary.
     """
-    original = dict(sample_action)
-
-    executor = executor_cls()
     executor.execute(sample_action)
 
-    assert sample_action == original
+    assert sample_action == _CANON_ACTION
 
 
 def test_executor_result_surface_is_explicit(
-    executor_cls: Type[DryRunExecutor],
-    sample_action: dict,
+    executor: DryRunExecutor,
+    sample_action: Dict[str, str],
 ) -> None:
     """
     The result surface must remain stable and explicit.
 
     This locks the public execution contract.
     """
-    executor = executor_cls()
     result = executor.execute(sample_action)
 
     # Required fields
@@ -136,17 +157,13 @@ def test_executor_result_surface_is_explicit(
 
 
 def test_executor_is_observable_via_result_not_logs(
-    caplog: pytest.LogCaptureFixture,
-    executor_cls: Type[DryRunExecutor],
-    sample_action: dict,
+    executor: DryRunExecutor,
+    sample_action: Dict[str, str],
 ) -> None:
     """
     Observability must come from ExecutionActionResult,
     not logging side effects.
     """
-    caplog.set_level(logging.INFO)
-
-    executor = executor_cls()
     result = executor.execute(sample_action)
 
     assert result.action_id == sample_action["id"]
\ No newline at end of file
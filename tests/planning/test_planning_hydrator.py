@@ -13,6 +13,7 @@ Hydration is responsible for:
 
 from __future__ import annotations
 
+import copy
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
@@ -31,41 +32,84 @@ from dita_package_processor.planning.models import (
 )
 
 
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+
+_VALID_PLAN_PAYLOAD: Dict[str, Any] = {
+    "plan_version": 1,
+    "generated_at": "2026-01-05T20:28:34.399100+00:00",
+    "source_discovery": {
+        "path": "discovery.json",
+        "schema_version": 1,
+        "artifact_count": 58,
+    },
+    "intent": {
+        "target": "analysis_only",
+        "description": "Auto-generated plan",
+    },
+    "actions": [
+        {
+            "id": "copy-main-map",
+            "type": "copy_map",  # must be a valid ActionType
+            "target": "index.ditamap",
+            "reason": "Single MAIN map detected",
+            "derived_from_evidence": ["main_map_by_index"],
+        }
+    ],
+    "invariants": [],
+}
+
+
+def _drop(key: str) -> Dict[str, Any]:
+    """Return a deep copy of the valid payload without ``key``."""
+    payload = copy.deepcopy(_VALID_PLAN_PAYLOAD)
+    payload.pop(key)
+    return payload
+
+
+def _set(key: str, value: Any) -> Dict[str, Any]:
+    """Return a deep copy of the valid payload with ``key`` replaced."""
+    payload = copy.deepcopy(_VALID_PLAN_PAYLOAD)
+    payload[key] = value
+    return payload
+
+
+# Built once at import; hydration never mutates its input.
+_BAD_PAYLOADS = [
+    ("missing_plan_version", _drop("plan_version")),
+    ("invalid_datetime", _set("generated_at", "not-a-datetime")),
+    (
+        "missing_action_type",
+        _set(
+            "actions",
+            [
+                {
+                    "id": "broken-action",
+                    "target": "index.ditamap",
+                    "reason": "Broken test",
+                }
+            ],
+        ),
+    ),
+]
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_plan_payload() -> Dict[str, Any]:
     """
     Return a minimal, valid plan payload as parsed from JSON.
 
     This fixture represents the canonical on-disk shape of plan.json.
+    Hydration only reads the payload, so one copy serves the module.
     """
-    return {
-        "plan_version": 1,
-        "generated_at": "2026-01-05T20:28:34.399100+00:00",
-        "source_discovery": {
-            "path": "discovery.json",
-            "schema_version": 1,
-            "artifact_count": 58,
-        },
-        "intent": {
-            "target": "analysis_only",
-            "description": "Auto-generated plan",
-        },
-        "actions": [
-            {
-                "id": "copy-main-map",
-                "type": "copy_map",  # must be a valid ActionType
-                "target": "index.ditamap",
-                "reason": "Single MAIN map detected",
-                "derived_from_evidence": ["main_map_by_index"],
-            }
-        ],
-        "invariants": [],
-    }
+    return _VALID_PLAN_PAYLOAD
 
 
 # ---------------------------------------------------------------------------
@@ -133,47 +177,26 @@ def test_hydrate_plan_defaults_optional_fields(
 # ---------------------------------------------------------------------------
 
 
-def test_hydrate_plan_missing_required_field_fails(
-    valid_plan_payload: Dict[str, Any],
-) -> None:
+@pytest.mark.parametrize(
+    "payload",
+    [payload for _, payload in _BAD_PAYLOADS],
+    ids=[case_id for case_id, _ in _BAD_PAYLOADS],
+)
+def test_hydrate_plan_invalid_payload_fails(payload: Dict[str, Any]) -> None:
     """
-    Missing required top-level fields must raise PlanHydrationError.
+    Missing required fields, malformed datetimes and incomplete actions
+    must all raise PlanHydrationError.
     """
-    payload = dict(valid_plan_payload)
-    payload.pop("plan_version")
-
     with pytest.raises(PlanHydrationError):
         hydrate_plan(payload)
 
 
-def test_hydrate_plan_invalid_datetime_fails(
-    valid_plan_payload: Dict[str, Any],
-) -> None:
+def test_hydrate_plan_does_not_mutate_payload() -> None:
     """
-    Invalid datetime formats must fail explicitly.
+    Hydration must only read its input; the shared payloads rely on it.
     """
-    payload = dict(valid_plan_payload)
-    payload["generated_at"] = "not-a-datetime"
-
-    with pytest.raises(PlanHydrationError):
-        hydrate_plan(payload)
+    payload = copy.deepcopy(_VALID_PLAN_PAYLOAD)
 
+    hydrate_plan(payload)
 
-def test_hydrate_plan_missing_action_field_fails(
-    valid_plan_payload: Dict[str, Any],
-) -> None:
-    """
-    Missing required action fields must fail hydration.
-    """
-    payload = dict(valid_plan_payload)
-    payload["actions"] = [
-        {
-            "id": "broken-action",
-            # missing type
-            "target": "index.ditamap",
-            "reason": "Broken test",
-        }
-    ]
-
-    with pytest.raises(PlanHydrationError):
-        hydrate_plan(payload)
\ No newline at end of file
+    assert payload == _VALID_PLAN_PAYLOAD
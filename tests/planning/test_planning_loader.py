@@ -2,7 +2,7 @@
 Tests for the planning plan loader.
 
 The loader is a hard boundary layer responsible for:
-- reading a plan JSON file from disk
+- reading a plan JSON file from disk (or from an open binary file)
 - parsing JSON strictly
 - delegating validation and typing to the hydrator
 - normalizing all failures into PlanLoadError
@@ -15,68 +15,109 @@ The loader:
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import Any, Dict
 
 import pytest
 
+from dita_package_processor.planning import loader
 from dita_package_processor.planning.loader import PlanLoadError, load_plan
 from dita_package_processor.planning.models import Plan
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+
+def _dumps(payload: Any) -> bytes:
+    """
+    Serialize a payload to JSON bytes.
+
+    Uses ``orjson`` when installed, the standard library otherwise.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Read-only: tests must copy it before changing it.
+_VALID_PLAN_DICT: Dict[str, Any] = {
+    "plan_version": 1,
+    "generated_at": "2026-01-01T00:00:00",
+    "source_discovery": {
+        "path": "/tmp/discovery.json",
+        "schema_version": 1,
+        "artifact_count": 1,
+    },
+    "intent": {
+        "target": "analysis_only",
+        "description": "Loader test plan",
+    },
+    "actions": [
+        {
+            "id": "noop-001",
+            "type": "noop",
+            "target": "index.ditamap",
+            "reason": "Test-only plan",
+            "parameters": {},
+            "derived_from_evidence": [],
+        }
+    ],
+    "invariants": [],
+}
+
+# Serialized once; every file and buffer fixture reuses these bytes.
+_VALID_PLAN_BYTES = _dumps(_VALID_PLAN_DICT)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_plan_dict() -> Dict[str, Any]:
     """
     Minimal syntactically valid plan payload.
 
     This is assumed to be semantically valid and is not intended
     to test planning logic. It only exercises the loader boundary.
+
+    Shared by the whole module: tests must copy it before changing it.
     """
-    return {
-        "plan_version": 1,
-        "generated_at": "2026-01-01T00:00:00",
-        "source_discovery": {
-            "path": "/tmp/discovery.json",
-            "schema_version": 1,
-            "artifact_count": 1,
-        },
-        "intent": {
-            "target": "analysis_only",
-            "description": "Loader test plan",
-        },
-        "actions": [
-            {
-                "id": "noop-001",
-                "type": "noop",
-                "target": "index.ditamap",
-                "reason": "Test-only plan",
-                "parameters": {},
-                "derived_from_evidence": [],
-            }
-        ],
-        "invariants": [],
-    }
+    return _VALID_PLAN_DICT
 
 
-@pytest.fixture
-def valid_plan_file(
-    tmp_path: Path,
-    valid_plan_dict: Dict[str, Any],
-) -> Path:
+@pytest.fixture(scope="module")
+def valid_plan_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Write a valid plan.json file to disk.
+    Write a valid plan.json file to disk once per module.
+
+    Loading never modifies the file, so every test reads the same copy.
     """
-    path = tmp_path / "plan.json"
-    path.write_text(json.dumps(valid_plan_dict), encoding="utf-8")
+    path = tmp_path_factory.mktemp("plan") / "plan.json"
+    path.write_bytes(_VALID_PLAN_BYTES)
     return path
 
 
+@pytest.fixture
+def valid_plan_buffer() -> io.BytesIO:
+    """
+    Provide a valid plan as an in-memory binary file.
+
+    Only tests about the filesystem itself need a real file.
+    """
+    return io.BytesIO(_VALID_PLAN_BYTES)
+
+
 # ---------------------------------------------------------------------------
 # Positive path
 # ---------------------------------------------------------------------------
@@ -90,14 +131,22 @@ def test_loader_reads_valid_plan(valid_plan_file: Path) -> None:
     assert isinstance(plan, Plan)
 
 
+def test_loader_accepts_string_path(valid_plan_file: Path) -> None:
+    """
+    A plain ``str`` path loads exactly like a ``Path``.
+    """
+    plan = load_plan(str(valid_plan_file))
+    assert isinstance(plan, Plan)
+
+
 def test_loader_preserves_plan_fields(
-    valid_plan_file: Path,
+    valid_plan_buffer: io.BytesIO,
     valid_plan_dict: Dict[str, Any],
 ) -> None:
     """
     Loaded Plan must reflect the hydrated payload.
     """
-    plan = load_plan(valid_plan_file)
+    plan = load_plan(valid_plan_buffer)
 
     assert plan.plan_version == valid_plan_dict["plan_version"]
     assert plan.intent.target == valid_plan_dict["intent"]["target"]
@@ -105,6 +154,20 @@ def test_loader_preserves_plan_fields(
     assert plan.actions[0].id == "noop-001"
 
 
+def test_loader_without_orjson_uses_stdlib_json(
+    valid_plan_buffer: io.BytesIO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    The stdlib parser must load the same plan when orjson is absent.
+    """
+    monkeypatch.setattr(loader, "_orjson", None)
+
+    plan = load_plan(valid_plan_buffer)
+
+    assert plan.actions[0].id == "noop-001"
+
+
 # ---------------------------------------------------------------------------
 # File read failures
 # ---------------------------------------------------------------------------
@@ -129,85 +192,71 @@ def test_loader_error_contains_filename_on_missing_file(tmp_path: Path) -> None:
     with pytest.raises(PlanLoadError) as exc:
         load_plan(path)
 
-    assert str(path) in str(exc.value)
+    message = exc.value.args[0] if exc.value.args else ""
+    assert str(path) in message
 
 
 # ---------------------------------------------------------------------------
-# JSON parse failures
+# Parse and hydration failures
 # ---------------------------------------------------------------------------
 
 
-def test_loader_fails_on_invalid_json(tmp_path: Path) -> None:
-    """
-    Invalid JSON must raise PlanLoadError.
+_MISSING_INTENT = {k: v for k, v in _VALID_PLAN_DICT.items() if k != "intent"}
+
+
+@pytest.mark.parametrize(
+    ("payload", "match"),
+    [
+        (b"{ not valid json", "Invalid JSON in plan file"),
+        (b'{"plan_version": "\xff"}', "Invalid JSON in plan file"),
+        (_dumps(["this", "is", "a", "list"]), "Plan hydration failed"),
+        (_dumps(_MISSING_INTENT), "Plan hydration failed"),
+    ],
+    ids=[
+        "invalid_json",
+        "non_utf8_bytes",
+        "json_not_mapping",
+        "hydration_error",
+    ],
+)
+def test_loader_rejects_bad_plan_file(
+    tmp_path: Path,
+    payload: bytes,
+    match: str,
+) -> None:
     """
-    path = tmp_path / "invalid.json"
-    path.write_text("{ not valid json", encoding="utf-8")
-
-    with pytest.raises(PlanLoadError, match="Invalid JSON in plan file"):
-        load_plan(path)
-
+    Parse and hydration failures must raise PlanLoadError naming the file.
 
-def test_loader_error_contains_filename_on_invalid_json(tmp_path: Path) -> None:
+    Undecodable bytes are a parse failure, not a crash. JSON that parses
+    but is not a valid plan object fails during hydration.
     """
-    Error message must include filename when JSON parsing fails.
-    """
-    path = tmp_path / "invalid.json"
-    path.write_text("{ not valid json", encoding="utf-8")
+    path = tmp_path / "plan.json"
+    path.write_bytes(payload)
 
-    with pytest.raises(PlanLoadError) as exc:
+    with pytest.raises(PlanLoadError, match=match) as exc:
         load_plan(path)
 
-    assert str(path) in str(exc.value)
-
+    message = exc.value.args[0] if exc.value.args else ""
+    assert str(path) in message
 
-# ---------------------------------------------------------------------------
-# Hydration failures
-# ---------------------------------------------------------------------------
 
-
-def test_loader_fails_when_json_is_not_mapping(tmp_path: Path) -> None:
+def test_loader_error_names_string_path(tmp_path: Path) -> None:
     """
-    JSON that parses but is not an object must fail during hydration.
+    String paths are reported as the path, not as ``<stream>``.
     """
-    path = tmp_path / "not_mapping.json"
-    path.write_text(json.dumps(["this", "is", "a", "list"]), encoding="utf-8")
+    path = str(tmp_path / "missing.json")
 
-    with pytest.raises(PlanLoadError, match="Plan hydration failed"):
+    with pytest.raises(PlanLoadError) as exc:
         load_plan(path)
 
-
-def test_loader_fails_on_hydration_error(
-    tmp_path: Path,
-    valid_plan_dict: Dict[str, Any],
-) -> None:
-    """
-    Any hydrator failure must be normalized to PlanLoadError.
-    """
-    invalid = dict(valid_plan_dict)
-    invalid.pop("intent")
-
-    path = tmp_path / "bad_plan.json"
-    path.write_text(json.dumps(invalid), encoding="utf-8")
-
-    with pytest.raises(PlanLoadError, match="Plan hydration failed"):
-        load_plan(path)
+    message = exc.value.args[0] if exc.value.args else ""
+    assert path in message
+    assert "<stream>" not in message
 
 
-def test_loader_error_contains_filename_on_hydration_failure(
-    tmp_path: Path,
-    valid_plan_dict: Dict[str, Any],
-) -> None:
+def test_loader_error_names_unnamed_stream() -> None:
     """
-    Hydration error messages must include filename.
+    Streams without a ``name`` are reported as ``<stream>``.
     """
-    invalid = dict(valid_plan_dict)
-    invalid.pop("intent")
-
-    path = tmp_path / "bad_plan.json"
-    path.write_text(json.dumps(invalid), encoding="utf-8")
-
-    with pytest.raises(PlanLoadError) as exc:
-        load_plan(path)
-
-    assert str(path) in str(exc.value)
\ No newline at end of file
+    with pytest.raises(PlanLoadError, match="<stream>"):
+        load_plan(io.BytesIO(b"{ not valid json"))
@@ -27,6 +27,12 @@ from dita_package_processor.planning.models import (
     PlanSourceDiscovery,
 )
 
+# Serialized action type strings, resolved once.
+_COPY_MAP = ActionType.COPY_MAP.value
+_COPY_TOPIC = ActionType.COPY_TOPIC.value
+_COPY_MEDIA = ActionType.COPY_MEDIA.value
+_NOOP = ActionType.NOOP.value
+
 
 # ---------------------------------------------------------------------------
 # PlanSourceDiscovery
@@ -96,7 +102,7 @@ def test_plan_action_copy_map_factory() -> None:
         reason="Root map copy",
     )
 
-    assert action.type == ActionType.COPY_MAP.value
+    assert action.type == _COPY_MAP
     assert action.parameters["source_path"] == "index.ditamap"
     assert action.parameters["target_path"] == "target/index.ditamap"
 
@@ -109,7 +115,7 @@ def test_plan_action_copy_topic_factory() -> None:
         reason="Topic dependency",
     )
 
-    assert action.type == ActionType.COPY_TOPIC.value
+    assert action.type == _COPY_TOPIC
 
 
 def test_plan_action_copy_media_factory() -> None:
@@ -120,7 +126,7 @@ def test_plan_action_copy_media_factory() -> None:
         reason="Media dependency",
     )
 
-    assert action.type == ActionType.COPY_MEDIA.value
+    assert action.type == _COPY_MEDIA
 
 
 # ---------------------------------------------------------------------------
@@ -203,7 +209,7 @@ def test_valid_action_type_is_accepted() -> None:
         target="index.ditamap",
         reason="Test",
     )
-    assert action.type == ActionType.NOOP.value
+    assert action.type == _NOOP
 
 
 def test_enum_action_type_is_accepted() -> None:
@@ -213,7 +219,7 @@ def test_enum_action_type_is_accepted() -> None:
         target="index.ditamap",
         reason="Test",
     )
-    assert action.type == ActionType.COPY_MAP.value
+    assert action.type == _COPY_MAP
 
 
 def test_invalid_action_type_fails() -> None:
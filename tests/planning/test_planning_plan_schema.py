@@ -9,35 +9,36 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict
 
 import jsonschema
 import pytest
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _load_schema_and_plan(
-    schema_path: Path,
-    plan_path: Path,
-) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    """
-    Load a JSON Schema and a plan instance from disk.
-
-    :param schema_path: Path to plan.schema.json
-    :param plan_path: Path to a plan fixture JSON file
-    :return: Tuple of (schema, plan)
+def _load_json(path: Path) -> Dict[str, Any]:
     """
-    with schema_path.open(encoding="utf-8") as fh:
-        schema = json.load(fh)
+    Parse a JSON file from its raw bytes.
 
-    with plan_path.open(encoding="utf-8") as fh:
-        plan = json.load(fh)
+    Uses ``orjson`` when installed, matching the planning loaders, and the
+    standard library otherwise.
 
-    return schema, plan
+    :param path: JSON file path
+    :return: Parsed JSON object
+    """
+    data = path.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 
 def _schema_path() -> Path:
@@ -66,12 +67,45 @@ def _fixture_path(name: str) -> Path:
     return Path(__file__).parent / "fixtures" / name
 
 
+def _load_plan(name: str) -> Dict[str, Any]:
+    """
+    Load a plan fixture by filename.
+
+    :param name: Fixture filename
+    :return: Parsed plan instance
+    """
+    return _load_json(_fixture_path(name))
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def plan_validator() -> jsonschema.protocols.Validator:
+    """
+    Build the plan schema validator once per module.
+
+    The schema is read from disk and checked once; every test then
+    validates against the same compiled validator.
+
+    :return: Validator for plan.schema.json
+    """
+    schema = _load_json(_schema_path())
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 # ---------------------------------------------------------------------------
 # Positive tests
 # ---------------------------------------------------------------------------
 
 
-def test_minimal_plan_conforms_to_schema() -> None:
+def test_minimal_plan_conforms_to_schema(
+    plan_validator: jsonschema.protocols.Validator,
+) -> None:
     """
     A minimal, hand-written plan JSON should validate
     against the plan schema.
@@ -79,25 +113,21 @@ def test_minimal_plan_conforms_to_schema() -> None:
     This test freezes the planning contract and ensures
     backward compatibility.
     """
-    schema, plan = _load_schema_and_plan(
-        _schema_path(),
-        _fixture_path("plan_minimal.json"),
-    )
+    plan = _load_plan("plan_minimal.json")
 
-    jsonschema.validate(instance=plan, schema=schema)
+    plan_validator.validate(plan)
 
 
-def test_plan_with_multiple_actions_conforms_to_schema() -> None:
+def test_plan_with_multiple_actions_conforms_to_schema(
+    plan_validator: jsonschema.protocols.Validator,
+) -> None:
     """
     A plan with multiple actions and invariants should
     validate successfully.
     """
-    schema, plan = _load_schema_and_plan(
-        _schema_path(),
-        _fixture_path("plan_with_actions.json"),
-    )
+    plan = _load_plan("plan_with_actions.json")
 
-    jsonschema.validate(instance=plan, schema=schema)
+    plan_validator.validate(plan)
 
 
 # ---------------------------------------------------------------------------
@@ -105,40 +135,37 @@ def test_plan_with_multiple_actions_conforms_to_schema() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_plan_missing_actions_fails_validation() -> None:
+def test_plan_missing_actions_fails_validation(
+    plan_validator: jsonschema.protocols.Validator,
+) -> None:
     """
     Plans without an actions array must be rejected.
     """
-    schema, plan = _load_schema_and_plan(
-        _schema_path(),
-        _fixture_path("plan_missing_actions.json"),
-    )
+    plan = _load_plan("plan_missing_actions.json")
 
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=plan, schema=schema)
+        plan_validator.validate(plan)
 
 
-def test_plan_with_unknown_action_type_fails_validation() -> None:
+def test_plan_with_unknown_action_type_fails_validation(
+    plan_validator: jsonschema.protocols.Validator,
+) -> None:
     """
     Plans containing unsupported action types must be rejected.
     """
-    schema, plan = _load_schema_and_plan(
-        _schema_path(),
-        _fixture_path("plan_unknown_action.json"),
-    )
+    plan = _load_plan("plan_unknown_action.json")
 
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=plan, schema=schema)
+        plan_validator.validate(plan)
 
 
-def test_plan_with_wrong_version_fails_validation() -> None:
+def test_plan_with_wrong_version_fails_validation(
+    plan_validator: jsonschema.protocols.Validator,
+) -> None:
     """
     Plans with unsupported plan_version values must be rejected.
     """
-    schema, plan = _load_schema_and_plan(
-        _schema_path(),
-        _fixture_path("plan_wrong_version.json"),
-    )
+    plan = _load_plan("plan_wrong_version.json")
 
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=plan, schema=schema)
\ No newline at end of file
+        plan_validator.validate(plan)
\ No newline at end of file
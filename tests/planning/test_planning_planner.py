@@ -12,7 +12,9 @@ Planner responsibilities
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from functools import lru_cache
+from typing import Any, Dict
 
 import pytest
 
@@ -22,12 +24,16 @@ from dita_package_processor.planning.contracts.planning_input import (
 )
 from dita_package_processor.planning.planner import Planner
 
+# Plan targets are POSIX-style, or use the host separator when built from Path.
+_TARGET_PREFIXES = ("target/", "target" + os.sep)
+
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
 def _minimal_planning_input() -> PlanningInput:
     """
     Construct a minimal valid PlanningInput instance.
@@ -35,6 +41,9 @@ def _minimal_planning_input() -> PlanningInput:
     This mirrors the strict contract boundary.
 
     Relationships exist but planner does not use them.
+
+    Cached: the planner never mutates its input, so every caller can
+    share one instance.
     """
     return PlanningInput(
         contract_version="planning.input.v1",
@@ -53,27 +62,40 @@ def _minimal_planning_input() -> PlanningInput:
     )
 
 
+@pytest.fixture(scope="module")
+def planner() -> Planner:
+    """
+    Planner shared by every test in this module.
+
+    Construction loads the plan schema from disk; the planner holds no
+    per-plan state, so one instance serves all tests.
+    """
+    return Planner()
+
+
+@pytest.fixture(scope="module")
+def plan(planner: Planner) -> Dict[str, Any]:
+    """
+    Plan for ``_minimal_planning_input()``, computed once per module.
+
+    Tests only read it.
+    """
+    return planner.plan(_minimal_planning_input())
+
+
 # =============================================================================
 # Positive tests
 # =============================================================================
 
 
-def test_planner_emits_copy_actions() -> None:
-    planner = Planner()
-
-    plan = planner.plan(_minimal_planning_input())
-
+def test_planner_emits_copy_actions(plan: Dict[str, Any]) -> None:
     actions = plan["actions"]
 
     assert len(actions) == 2
     assert {a["type"] for a in actions} == {"copy_map", "copy_topic"}
 
 
-def test_planner_action_schema_shape() -> None:
-    planner = Planner()
-
-    plan = planner.plan(_minimal_planning_input())
-
+def test_planner_action_schema_shape(plan: Dict[str, Any]) -> None:
     action = plan["actions"][0]
 
     assert "id" in action
@@ -89,21 +111,12 @@ def test_planner_action_schema_shape() -> None:
     assert action["target"] == params["target_path"]
 
 
-def test_planner_targets_rooted_in_target_directory() -> None:
-    planner = Planner()
-
-    plan = planner.plan(_minimal_planning_input())
-
+def test_planner_targets_rooted_in_target_directory(plan: Dict[str, Any]) -> None:
     for action in plan["actions"]:
-        target = Path(action["target"])
-        assert target.parts[0] == "target"
-
+        assert action["target"].startswith(_TARGET_PREFIXES)
 
-def test_plan_structure() -> None:
-    planner = Planner()
-
-    plan = planner.plan(_minimal_planning_input())
 
+def test_plan_structure(plan: Dict[str, Any]) -> None:
     assert plan["plan_version"] == 1
     assert "generated_at" in plan
     assert "source_discovery" in plan
@@ -112,36 +125,41 @@ def test_plan_structure() -> None:
     assert isinstance(plan["invariants"], list)
 
 
+def test_planner_does_not_mutate_input(planner: Planner) -> None:
+    """
+    plan() must leave its input untouched; the cached input relies on it.
+    """
+    shared = _minimal_planning_input()
+
+    planner.plan(shared)
+
+    assert shared.to_dict() == _minimal_planning_input.__wrapped__().to_dict()
+
+
 # =============================================================================
 # Contract wall tests (architectural enforcement)
 # =============================================================================
 
 
-def test_planner_rejects_raw_dict() -> None:
+def test_planner_rejects_raw_dict(planner: Planner) -> None:
     """
     Planner must refuse raw dictionaries.
 
     Only PlanningInput objects are allowed.
     """
-    planner = Planner()
-
     with pytest.raises(TypeError):
         planner.plan({"artifacts": []})
 
 
-def test_planner_requires_planning_input_type() -> None:
-    planner = Planner()
-
+def test_planner_requires_planning_input_type(planner: Planner) -> None:
     with pytest.raises(TypeError):
         planner.plan([])
 
 
-def test_planner_deterministic_ordering() -> None:
+def test_planner_deterministic_ordering(planner: Planner) -> None:
     """
     Artifact ordering must be stable and path-sorted.
     """
-    planner = Planner()
-
     inp = PlanningInput(
         contract_version="planning.input.v1",
         main_map="z.ditamap",
@@ -54,6 +54,23 @@ def test_normalizer_drops_media_nodes() -> None:
     assert "media/logo.png" not in nodes
 
 
+def test_normalizer_drops_media_artifacts() -> None:
+    discovery = {
+        "artifacts": [
+            {"path": "index.ditamap", "artifact_type": "map"},
+            {"path": "media/logo.png", "artifact_type": "media"},
+        ],
+        "graph": {
+            "nodes": ["index.ditamap", "media/logo.png"],
+            "edges": [],
+        },
+    }
+
+    normalized = PlanningInputNormalizer.normalize(discovery)
+
+    assert [a["path"] for a in normalized["artifacts"]] == ["index.ditamap"]
+
+
 def test_normalizer_drops_media_edges() -> None:
     discovery = {
         "artifacts": [
@@ -136,6 +153,87 @@ def test_normalizer_normalizes_paths() -> None:
     assert normalized["artifacts"][0]["path"] == "index.ditamap"
 
 
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("./index.ditamap", "index.ditamap"),
+        ("topics//a.dita", "topics/a.dita"),
+        ("topics/./a.dita", "topics/a.dita"),
+        ("topics/a.dita/", "topics/a.dita"),
+        ("topics\\a.dita", "topics/a.dita"),
+    ],
+)
+def test_normalizer_canonicalizes_path_forms(raw: str, expected: str) -> None:
+    discovery = {
+        "artifacts": [{"path": raw, "artifact_type": "topic"}],
+        "graph": {"nodes": [raw], "edges": []},
+    }
+
+    normalized = PlanningInputNormalizer.normalize(discovery)
+
+    assert normalized["artifacts"][0]["path"] == expected
+    assert normalized["graph"]["nodes"] == [expected]
+
+
+def test_normalizer_deduplicates_nodes_in_order() -> None:
+    discovery = {
+        "artifacts": [
+            {"path": "index.ditamap", "artifact_type": "map"},
+            {"path": "topics/a.dita", "artifact_type": "topic"},
+        ],
+        "graph": {
+            "nodes": [
+                "index.ditamap",
+                "topics/a.dita",
+                "./index.ditamap",
+                "topics/a.dita",
+            ],
+            "edges": [],
+        },
+    }
+
+    normalized = PlanningInputNormalizer.normalize(discovery)
+
+    assert normalized["graph"]["nodes"] == ["index.ditamap", "topics/a.dita"]
+
+
+def test_normalizer_deduplicates_edges() -> None:
+    discovery = {
+        "artifacts": [
+            {"path": "index.ditamap", "artifact_type": "map"},
+            {"path": "topics/a.dita", "artifact_type": "topic"},
+        ],
+        "graph": {
+            "nodes": ["index.ditamap", "topics/a.dita"],
+            "edges": [
+                {
+                    "source": "index.ditamap",
+                    "target": "topics/a.dita",
+                    "type": "topicref",
+                    "pattern_id": "first",
+                },
+                {
+                    "source": "./index.ditamap",
+                    "target": "topics/a.dita",
+                    "type": "topicref",
+                    "pattern_id": "second",
+                },
+                {
+                    "source": "index.ditamap",
+                    "target": "topics/a.dita",
+                    "type": "xref",
+                    "pattern_id": "third",
+                },
+            ],
+        },
+    }
+
+    normalized = PlanningInputNormalizer.normalize(discovery)
+
+    edges = normalized["graph"]["edges"]
+    assert [e["pattern_id"] for e in edges] == ["first", "third"]
+
+
 def test_functional_alias_matches_class_method() -> None:
     discovery = {
         "artifacts": [
@@ -257,4 +355,19 @@ def test_normalizer_fails_on_invalid_path_type() -> None:
     }
 
     with pytest.raises(ValueError, match="Invalid artifact path"):
-        PlanningInputNormalizer.normalize(discovery)
\ No newline at end of file
+        PlanningInputNormalizer.normalize(discovery)
+
+
+def test_normalizer_fails_on_unhashable_path() -> None:
+    discovery = {
+        "artifacts": [
+            {"path": ["index.ditamap"], "artifact_type": "map"},  # type: ignore[arg-type]
+        ],
+        "graph": {
+            "nodes": [],
+            "edges": [],
+        },
+    }
+
+    with pytest.raises(ValueError, match="Invalid artifact path"):
+        PlanningInputNormalizer.normalize(discovery)
@@ -0,0 +1,66 @@
+"""
+Tests for the schema documentation generator in tools/.
+
+The parallel rendering path must produce byte-identical output to the
+sequential one.
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def schema_docs(monkeypatch):
+    """
+    Import tools/generate_schema_docs.py as a top-level module.
+
+    The tools directory is put on ``sys.path`` (not loaded from a file
+    spec) so worker processes can unpickle the module-level renderer.
+    """
+    monkeypatch.syspath_prepend(str(REPO_ROOT / "tools"))
+    return importlib.import_module("generate_schema_docs")
+
+
+def _write_schemas(repo_root: Path, count: int) -> None:
+    schema_dir = repo_root / "dita_package_processor" / "schemas"
+    schema_dir.mkdir(parents=True)
+    for idx in range(count):
+        (schema_dir / f"s{idx}.schema.json").write_text(
+            '{"title": "S%d", "required": ["a"], "properties": '
+            '{"a": {"type": "string", "description": "A"}, "b": true}}' % idx,
+            encoding="utf-8",
+        )
+    (schema_dir / "extra.schema.yaml").write_text(
+        "title: Extra\nproperties:\n  c:\n    $ref: '#/x'\n",
+        encoding="utf-8",
+    )
+
+
+def _read_outputs(output_dir: Path) -> dict[str, str]:
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(output_dir.iterdir())
+    }
+
+
+def test_parallel_output_matches_sequential(
+    tmp_path: Path, monkeypatch, schema_docs
+) -> None:
+    _write_schemas(tmp_path, count=5)
+
+    sequential_dir = tmp_path / "sequential"
+    schema_docs.SchemaDocGenerator(tmp_path, sequential_dir).run()
+
+    monkeypatch.setattr(schema_docs, "_PARALLEL_THRESHOLD", 0)
+    parallel_dir = tmp_path / "parallel"
+    schema_docs.SchemaDocGenerator(tmp_path, parallel_dir).run()
+
+    sequential = _read_outputs(sequential_dir)
+    assert len(sequential) == 6
+    assert _read_outputs(parallel_dir) == sequential
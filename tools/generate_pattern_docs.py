@@ -7,16 +7,26 @@ Patterns are treated as declarative, auditable facts about real-world
 DITA packages.
 
 The output is designed for MkDocs consumption.
+
+YAML is read and written with PyYAML's libyaml-backed safe loader and
+dumper when available, and the pure-Python ones otherwise.
 """
 
 from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -44,33 +54,30 @@ class PatternRenderer:
         :param pattern: Pattern definition from YAML
         :return: Markdown content
         """
-        lines: List[str] = []
-
-        lines.append(f"# Pattern: `{pattern['id']}`")
-        lines.append("")
-
-        lines.append("## Applies To")
-        lines.append(f"`{pattern['applies_to']}`")
-        lines.append("")
-
-        lines.append("## Signals")
-        lines.append("```yaml")
-        lines.append(yaml.safe_dump(pattern.get("signals", {}), sort_keys=False))
-        lines.append("```")
-        lines.append("")
-
-        lines.append("## Asserts")
-        lines.append("```yaml")
-        lines.append(yaml.safe_dump(pattern.get("asserts", {}), sort_keys=False))
-        lines.append("```")
-        lines.append("")
+        signals = yaml.dump(
+            pattern.get("signals", {}),
+            Dumper=_SafeDumper,
+            sort_keys=False,
+        )
+        asserts = yaml.dump(
+            pattern.get("asserts", {}),
+            Dumper=_SafeDumper,
+            sort_keys=False,
+        )
+
+        # One element per section; the trailing "\n" is the blank line
+        # that separates it from the next section after the final join.
+        lines: List[str] = [
+            f"# Pattern: `{pattern['id']}`\n",
+            f"## Applies To\n`{pattern['applies_to']}`\n",
+            f"## Signals\n```yaml\n{signals}\n```\n",
+            f"## Asserts\n```yaml\n{asserts}\n```\n",
+        ]
 
         rationale = pattern.get("rationale", [])
         if rationale:
-            lines.append("## Rationale")
-            for item in rationale:
-                lines.append(f"- {item}")
-            lines.append("")
+            items = "\n".join(f"- {item}" for item in rationale)
+            lines.append(f"## Rationale\n{items}\n")
 
         return "\n".join(lines)
 
@@ -115,19 +122,22 @@ class PatternDocGenerator:
             "",
         ]
 
+        # Render everything first so a bad pattern fails before any file
+        # is touched, then write each document in one binary write.
+        docs: List[Tuple[str, bytes]] = []
         for pattern in patterns:
-            doc = self.renderer.render(pattern)
             filename = f"{pattern['id']}.md"
-            target = self.output_dir / filename
-
-            target.write_text(doc, encoding="utf-8")
-            LOGGER.info("Wrote %s", target)
-
+            docs.append(
+                (filename, self.renderer.render(pattern).encode("utf-8"))
+            )
             index_lines.append(f"- [{pattern['id']}]({filename})")
 
-        index_path = self.output_dir / "index.md"
-        index_path.write_text("\n".join(index_lines), encoding="utf-8")
-        LOGGER.info("Wrote %s", index_path)
+        docs.append(("index.md", "\n".join(index_lines).encode("utf-8")))
+
+        for filename, content in docs:
+            target = self.output_dir / filename
+            target.write_bytes(content)
+            LOGGER.info("Wrote %s", target)
 
     def _load_patterns(self) -> Dict[str, Any]:
         """
@@ -135,7 +145,7 @@ class PatternDocGenerator:
         """
         LOGGER.info("Loading patterns from %s", self.patterns_file)
         with self.patterns_file.open("r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh)
+            return yaml.load(fh, Loader=_SafeLoader)
 
 
 # ---------------------------------------------------------------------------
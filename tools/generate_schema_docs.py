@@ -16,8 +16,23 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -29,10 +44,24 @@ logging.basicConfig(
     format="%(levelname)s | %(name)s | %(message)s",
 )
 
+# Below this many schemas, process start-up costs more than it saves.
+_PARALLEL_THRESHOLD = 16
+
+_SCHEMA_SUFFIXES = (".schema.json", ".schema.yaml", ".schema.yml")
+
 # ---------------------------------------------------------------------------
 # Schema Parsing
 # ---------------------------------------------------------------------------
 
+# Schema keywords that determine a field's rendered type, in priority order.
+_TYPE_RENDERERS: Tuple[Tuple[str, Callable[[Dict[str, Any]], str]], ...] = (
+    ("type", lambda spec: str(spec["type"])),
+    ("$ref", lambda spec: f"ref({spec['$ref']})"),
+    ("oneOf", lambda spec: "oneOf"),
+    ("anyOf", lambda spec: "anyOf"),
+    ("allOf", lambda spec: "allOf"),
+)
+
 
 class JsonSchemaParser:
     """
@@ -53,18 +82,12 @@ class JsonSchemaParser:
         title = raw.get("title", source_path.stem)
         description = raw.get("description", "")
 
-        lines: List[str] = [
-            f"# {title}",
-            "",
-        ]
+        # Section elements carry their own trailing blank line, so the
+        # single join at the end needs no separate "" entries.
+        lines: List[str] = [f"# {title}\n"]
 
         if description:
-            lines.extend(
-                [
-                    description,
-                    "",
-                ]
-            )
+            lines.append(f"{description}\n")
 
         properties = raw.get("properties")
         if not isinstance(properties, dict):
@@ -76,23 +99,20 @@ class JsonSchemaParser:
 
         required = raw.get("required", [])
 
-        lines.extend(
-            [
-                "## Properties",
-                "",
-                "| Name | Type | Required | Description |",
-                "|------|------|----------|-------------|",
-            ]
+        # The whole table is one element: header plus one "\n"-led row
+        # per property.
+        rows = "".join(
+            f"\n| `{name}` | {self._render_type(spec)} | "
+            f"{'yes' if name in required else 'no'} | "
+            f"{self._render_description(spec)} |"
+            for name, spec in properties.items()
+        )
+        lines.append(
+            "## Properties\n"
+            "\n"
+            "| Name | Type | Required | Description |\n"
+            f"|------|------|----------|-------------|{rows}"
         )
-
-        for name, spec in properties.items():
-            field_type = self._render_type(spec)
-            is_required = "yes" if name in required else "no"
-            field_desc = self._render_description(spec)
-
-            lines.append(
-                f"| `{name}` | {field_type} | {is_required} | {field_desc} |"
-            )
 
         return "\n".join(lines)
 
@@ -110,20 +130,9 @@ class JsonSchemaParser:
         if not isinstance(spec, dict):
             return "unknown"
 
-        if "type" in spec:
-            return str(spec["type"])
-
-        if "$ref" in spec:
-            return f"ref({spec['$ref']})"
-
-        if "oneOf" in spec:
-            return "oneOf"
-
-        if "anyOf" in spec:
-            return "anyOf"
-
-        if "allOf" in spec:
-            return "allOf"
+        for keyword, render in _TYPE_RENDERERS:
+            if keyword in spec:
+                return render(spec)
 
         return "object"
 
@@ -162,9 +171,27 @@ class SchemaDocGenerator:
         """
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        for path in self._find_schema_files():
-            LOGGER.info("Processing schema: %s", path)
-            self._process_schema(path)
+        paths = list(self._find_schema_files())
+
+        if len(paths) < _PARALLEL_THRESHOLD:
+            for path in paths:
+                LOGGER.info("Processing schema: %s", path)
+                self._process_schema(path)
+            return
+
+        # Render in worker processes, then write in discovery order so the
+        # output is identical to a sequential run.
+        LOGGER.info("Rendering %d schemas in parallel", len(paths))
+        try:
+            with ProcessPoolExecutor() as executor:
+                render = partial(_render_schema, self.parser)
+                docs = list(executor.map(render, paths, chunksize=8))
+        except Exception:
+            LOGGER.exception("Schema documentation generation failed.")
+            raise
+
+        for path, doc in zip(paths, docs):
+            self._write_doc(path, doc)
 
     def _find_schema_files(self) -> Iterable[Path]:
         """
@@ -177,14 +204,11 @@ class SchemaDocGenerator:
         """
         source_root = self.repo_root / "dita_package_processor"
 
-        for path in source_root.rglob("*.schema.json"):
-            yield path
-
-        for path in source_root.rglob("*.schema.yaml"):
-            yield path
-
-        for path in source_root.rglob("*.schema.yml"):
-            yield path
+        # One walk covers every schema suffix.
+        for dirpath, _, filenames in os.walk(source_root):
+            for name in filenames:
+                if name.endswith(_SCHEMA_SUFFIXES):
+                    yield Path(dirpath) / name
 
     def _process_schema(self, path: Path) -> None:
         """
@@ -203,11 +227,21 @@ class SchemaDocGenerator:
         """
         Load a JSON Schema file.
 
+        ``*.schema.json`` files are parsed from raw bytes with ``orjson``
+        when installed (the standard library otherwise); ``*.schema.yaml``
+        and ``*.schema.yml`` files are parsed as YAML.
+
         :param path: Schema file path
         :return: Parsed schema
         """
-        with path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        data = path.read_bytes()
+
+        if path.suffix in (".yaml", ".yml"):
+            return yaml.load(data, Loader=_SafeLoader)
+
+        if _orjson is not None:
+            return _orjson.loads(data)
+        return json.loads(data)
 
     def _write_doc(self, schema_path: Path, content: str) -> None:
         """
@@ -220,6 +254,21 @@ class SchemaDocGenerator:
         LOGGER.info("Wrote %s", target)
 
 
+def _render_schema(parser: JsonSchemaParser, path: Path) -> str:
+    """
+    Load and render one schema in a worker process.
+
+    Module-level so it can be pickled by ``ProcessPoolExecutor``. The
+    generator passes its own parser so both paths render identically.
+
+    :param parser: Parser used by the generator
+    :param path: Schema file path
+    :return: Markdown document
+    """
+    LOGGER.info("Processing schema: %s", path)
+    return parser.parse(SchemaDocGenerator._load_schema(path), path)
+
+
 # ---------------------------------------------------------------------------
 # Entry Point
 # ---------------------------------------------------------------------------
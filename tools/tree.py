@@ -14,10 +14,14 @@ Key guarantees:
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Tuple
 
 # ------------------------------------------------------------
 # Ignore handling
@@ -54,78 +58,202 @@ def is_ignored(path: Path, patterns: List[str], root: Path) -> bool:
     :param root: Scan root
     :return: True if ignored
     """
-    rel = path.relative_to(root).as_posix()
+    ignored = compile_ignore_patterns(patterns)
+    return ignored(path.relative_to(root).as_posix())
 
-    for pattern in patterns:
-        # Directory ignore
-        if pattern.endswith("/") and rel.startswith(pattern[:-1]):
-            return True
 
-        # Glob ignore
-        if fnmatch.fnmatch(rel, pattern):
+def compile_ignore_patterns(patterns: List[str]) -> Callable[[str], bool]:
+    """
+    Compile ignore patterns into a single matcher.
+
+    Directory patterns (trailing '/') match as a literal prefix of the
+    root-relative path; every pattern is also matched as a glob, exactly
+    as ``fnmatch`` would. Both kinds are folded into one alternation regex
+    each, so a path is tested with at most two regex calls.
+
+    Compiled matchers are cached per pattern tuple, so repeated calls
+    (e.g. from ``is_ignored``) compile only once.
+
+    :param patterns: Ignore patterns
+    :return: Predicate taking a root-relative POSIX path
+    """
+    return _compile_ignore_patterns(tuple(patterns))
+
+
+@lru_cache(maxsize=None)
+def _compile_ignore_patterns(
+    patterns: Tuple[str, ...],
+) -> Callable[[str], bool]:
+    """
+    Build the matcher for ``compile_ignore_patterns``.
+
+    :param patterns: Ignore patterns, as a hashable tuple
+    :return: Predicate taking a root-relative POSIX path
+    """
+    prefixes = [p[:-1] for p in patterns if p.endswith("/")]
+
+    dir_re = (
+        re.compile("|".join(re.escape(p) for p in prefixes))
+        if prefixes
+        else None
+    )
+    glob_re = (
+        re.compile("|".join(fnmatch.translate(p) for p in patterns))
+        if patterns
+        else None
+    )
+
+    def ignored(rel: str) -> bool:
+        if dir_re is not None and dir_re.match(rel):
             return True
+        return glob_re is not None and glob_re.match(rel) is not None
 
-    return False
+    return ignored
 
 
 # ------------------------------------------------------------
 # Tree building and metrics
 # ------------------------------------------------------------
 
-file_count = 0
-dir_count = 0
-line_count = 0
+@dataclass
+class Metrics:
+    """
+    Running totals for a tree scan.
+
+    Passed through ``build_tree`` instead of module globals, so each scan
+    owns its own counts.
+    """
+
+    files: int = 0
+    dirs: int = 0
+    lines: int = 0
+
+
+def count_lines(path: str) -> int:
+    """
+    Count lines in a file without decoding it.
+
+    The file is read as raw bytes in 1 MiB chunks and newlines are counted
+    with ``bytes.count``. A final line without a trailing newline still
+    counts, matching iteration over the file in text mode.
+
+    :param path: File to count
+    :return: Number of lines
+    """
+    lines = 0
+    last = b"\n"
+
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+
+    return lines if last == b"\n" else lines + 1
+
+
+def _join_rel(parent: str, name: str) -> str:
+    """Join a root-relative parent path and an entry name."""
+    return name if parent in ("", ".") else f"{parent}/{name}"
+
+
+def _scan_dir(
+    dir_path: str,
+    rel: str,
+    ignored: Callable[[str], bool],
+) -> List[os.DirEntry]:
+    """
+    List one directory's visible entries, directories first.
+
+    ``os.scandir`` reads entry types with the directory listing, so the
+    symlink, directory and file checks below need no extra ``stat`` calls.
+
+    :param dir_path: Directory to list
+    :param rel: Directory path relative to the scan root
+    :param ignored: Compiled ignore matcher
+    :return: Sorted, filtered entries (empty if unreadable)
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = [
+                e for e in it
+                if not e.is_symlink()
+                and not ignored(_join_rel(rel, e.name))
+            ]
+    except PermissionError:
+        return []
+
+    entries.sort(key=lambda e: (e.is_file(), e.name.lower()))
+    return entries
 
 
 def build_tree(
     path: Path,
     root: Path,
     ignore: List[str],
+    metrics: Metrics,
     prefix: str = "",
 ) -> List[str]:
     """
-    Recursively build an ASCII tree representation.
+    Build an ASCII tree representation.
+
+    The walk is depth-first with an explicit stack, so deep trees do not
+    hit the recursion limit; line order matches a recursive walk.
 
     :param path: Current directory
     :param root: Scan root
     :param ignore: Ignore patterns
+    :param metrics: Totals updated in place
     :param prefix: Tree prefix
     :return: List of tree lines
     """
-    global file_count, dir_count, line_count
-
     lines: List[str] = []
 
-    try:
-        entries = sorted(
-            [
-                e for e in path.iterdir()
-                if not e.is_symlink() and not is_ignored(e, ignore, root)
-            ],
-            key=lambda p: (p.is_file(), p.name.lower()),
-        )
-    except PermissionError:
-        return lines
+    ignored = compile_ignore_patterns(ignore)
+
+    rel = path.relative_to(root).as_posix()
+    entries = _scan_dir(os.fspath(path), rel, ignored)
+
+    # Each frame: (entries, next index, prefix, directory rel path)
+    stack = [(entries, 0, prefix, rel)]
+
+    while stack:
+        entries, index, prefix, rel = stack.pop()
+        if index >= len(entries):
+            continue
+
+        # Resume this directory at the next entry once the current one is done.
+        stack.append((entries, index + 1, prefix, rel))
 
-    for index, entry in enumerate(entries):
-        connector = "└── " if index == len(entries) - 1 else "├── "
+        entry = entries[index]
+        last = index == len(entries) - 1
+        connector = "└── " if last else "├── "
         lines.append(f"{prefix}{connector}{entry.name}")
 
-        if entry.is_dir():
-            dir_count += 1
-            extension = "    " if index == len(entries) - 1 else "│   "
-            lines.extend(build_tree(entry, root, ignore, prefix + extension))
+        if entry.is_dir(follow_symlinks=False):
+            metrics.dirs += 1
+            extension = "    " if last else "│   "
+            child_rel = _join_rel(rel, entry.name)
+            stack.append(
+                (
+                    _scan_dir(entry.path, child_rel, ignored),
+                    0,
+                    prefix + extension,
+                    child_rel,
+                )
+            )
         else:
-            file_count += 1
+            metrics.files += 1
             try:
-                with entry.open("r", encoding="utf-8", errors="ignore") as f:
-                    line_count += sum(1 for _ in f)
+                metrics.lines += count_lines(entry.path)
             except Exception:
                 pass
 
         # Heartbeat every ~200 files
-        if file_count > 0 and file_count % 200 == 0:
-            print(f"Scanning… {file_count} files, {dir_count} dirs, {line_count} lines")
+        if metrics.files > 0 and metrics.files % 200 == 0:
+            print(
+                f"Scanning… {metrics.files} files, {metrics.dirs} dirs, "
+                f"{metrics.lines} lines"
+            )
 
     return lines
 
@@ -135,8 +263,6 @@ def build_tree(
 # ------------------------------------------------------------
 
 def main() -> None:
-    global file_count, dir_count, line_count
-
     # Scan root is always the repository root (cwd)
     root = Path.cwd()
 
@@ -155,7 +281,8 @@ def main() -> None:
     start = time.time()
 
     tree_lines = [root.name]
-    tree_lines.extend(build_tree(root, root, ignore_patterns))
+    metrics = Metrics()
+    tree_lines.extend(build_tree(root, root, ignore_patterns, metrics))
 
     elapsed = time.time() - start
 
@@ -173,9 +300,9 @@ def main() -> None:
         "",
         "PROJECT METRICS",
         "=" * 60,
-        f"Directories: {dir_count}",
-        f"Files:       {file_count}",
-        f"Lines of code: {line_count}",
+        f"Directories: {metrics.dirs}",
+        f"Files:       {metrics.files}",
+        f"Lines of code: {metrics.lines}",
         f"Scan time:    {elapsed:.2f} seconds",
         "",
         "Interpretation:",
@@ -189,9 +316,9 @@ def main() -> None:
     output_file.write_text("\n".join(report), encoding="utf-8")
 
     print("\nScan complete.")
-    print(f"Files: {file_count}")
-    print(f"Dirs: {dir_count}")
-    print(f"Lines: {line_count}")
+    print(f"Files: {metrics.files}")
+    print(f"Dirs: {metrics.dirs}")
+    print(f"Lines: {metrics.lines}")
     print(f"Time: {elapsed:.2f}s")
     print(f"Report written to: {output_file}\n")
 